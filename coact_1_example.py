@@ -12,6 +12,7 @@ The system consists of three agents:
 """
 
 import asyncio
+import importlib.util
 import os
 import sys
 import logging
@@ -22,19 +23,14 @@ import base64
 import argparse
 from typing import List, Dict, Any, Optional
 
-# Add local CUA directory to Python path (for development)
-cua_path = os.path.join(os.path.dirname(__file__), "cua", "libs", "python")
-if cua_path not in sys.path:
-    sys.path.insert(0, cua_path)
-
-# Also add individual package paths (needed for inter-package imports)
-agent_path = os.path.join(cua_path, "agent")
-computer_path = os.path.join(cua_path, "computer")
-core_path = os.path.join(cua_path, "core")
-
-for path in [agent_path, computer_path, core_path]:
-    if path not in sys.path:
-        sys.path.insert(0, path)
+# Use the local CUA packages. With an editable install
+#   pip install -e cua/libs/python/core -e cua/libs/python/computer -e cua/libs/python/agent
+# they are already importable and sys.path is left alone; otherwise (e.g. only the
+# PyPI cua-agent is installed) the local package directories are put in front once.
+cua_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cua", "libs", "python")
+_agent_spec = importlib.util.find_spec("agent")
+if _agent_spec is None or not (_agent_spec.origin or "").startswith(cua_path):
+    sys.path[:0] = [os.path.join(cua_path, name) for name in ("agent", "computer", "core")]
 
 # Import CUA components
 from agent import ComputerAgent
@@ -2,7 +2,7 @@ import asyncio
 import functools
 import warnings
 from concurrent.futures import ThreadPoolExecutor
-from typing import Iterator, AsyncIterator, Dict, List, Any, Optional
+from typing import Iterator, AsyncIterator, Dict, List, Any, Optional, Tuple
 from litellm.types.utils import GenericStreamingChunk, ModelResponse
 from litellm.llms.custom_llm import CustomLLM
 from litellm import completion, acompletion
@@ -17,6 +17,82 @@ except ImportError:
 
 from .models import load_model as load_model_handler
 
+class BatchedGroundingRunner:
+    """Coalesces concurrent generate requests for the same local model into batched passes.
+
+    Requests arriving within ``timeout`` seconds of the first pending one (up to
+    ``max_batch_size``) and asking for the same ``max_new_tokens`` are left-padded into a
+    single ``generate_batch`` call on the handler; handlers without ``generate_batch`` fall
+    back to one ``generate`` per request.
+    """
+
+    def __init__(self, adapter: "HuggingFaceLocalAdapter", max_batch_size: int = 8, timeout: float = 0.01) -> None:
+        self.adapter = adapter
+        self.max_batch_size = max_batch_size
+        self.timeout = timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+
+    async def submit(self, model_name: str, messages: List[Dict[str, Any]], max_new_tokens: int) -> str:
+        """Queue one conversation and wait for its generated text."""
+        loop = asyncio.get_running_loop()
+        # Workers are bound to the loop they were started on
+        if self._loop is not loop:
+            self._loop = loop
+            self._queues = {}
+            self._workers = {}
+        worker = self._workers.get(model_name)
+        if worker is None or worker.done():
+            self._queues[model_name] = asyncio.Queue()
+            self._workers[model_name] = loop.create_task(self._run(model_name, self._queues[model_name]))
+
+        future = loop.create_future()
+        await self._queues[model_name].put((messages, max_new_tokens, future))
+        return await future
+
+    async def _run(self, model_name: str, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.timeout
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Each request keeps its own token budget, so only requests with the same
+            # max_new_tokens share a generate pass
+            groups: Dict[int, List[Tuple[List[Dict[str, Any]], asyncio.Future]]] = {}
+            for messages, max_new_tokens, future in batch:
+                groups.setdefault(max_new_tokens, []).append((messages, future))
+
+            for max_new_tokens, group in groups.items():
+                batch_messages = [messages for messages, _ in group]
+                try:
+                    outputs = await loop.run_in_executor(
+                        self.adapter._executor,
+                        functools.partial(self._generate_batch, model_name, batch_messages, max_new_tokens),
+                    )
+                except Exception as e:
+                    for _, future in group:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for (_, future), output in zip(group, outputs):
+                        if not future.done():
+                            future.set_result(output)
+
+    def _generate_batch(self, model_name: str, batch_messages: List[List[Dict[str, Any]]], max_new_tokens: int) -> List[str]:
+        handler = self.adapter._get_handler(model_name)
+        if len(batch_messages) > 1 and hasattr(handler, "generate_batch"):
+            return handler.generate_batch(batch_messages, max_new_tokens=max_new_tokens)
+        return [handler.generate(messages, max_new_tokens=max_new_tokens) for messages in batch_messages]
+
 class HuggingFaceLocalAdapter(CustomLLM):
     """HuggingFace Local Adapter for running vision-language models locally."""
     
@@ -34,6 +110,8 @@ class HuggingFaceLocalAdapter(CustomLLM):
         # Cache for model handlers keyed by model_name
         self._handlers: Dict[str, Any] = {}
         self._executor = ThreadPoolExecutor(max_workers=1)  # Single thread pool
+        # Async calls go through the batching runner so concurrent requests share a forward pass
+        self._runner = BatchedGroundingRunner(self)
         
     def _get_handler(self, model_name: str):
         """Get or create a model handler for the given model name."""
@@ -85,14 +163,11 @@ class HuggingFaceLocalAdapter(CustomLLM):
             
         return converted_messages
     
-    def _generate(self, **kwargs) -> str:
-        """Generate response using the local HuggingFace model.
+    def _prepare(self, **kwargs) -> Tuple[str, List[Dict[str, Any]], int]:
+        """Validate kwargs and return (model_name, HF-format messages, max_new_tokens).
         
         Args:
             **kwargs: Keyword arguments containing messages and model info
-            
-        Returns:
-            Generated text response
         """
         if not HF_AVAILABLE:
             raise ImportError(
@@ -112,6 +187,18 @@ class HuggingFaceLocalAdapter(CustomLLM):
         
         # Convert messages to HuggingFace format
         hf_messages = self._convert_messages(messages)
+        return model_name, hf_messages, max_new_tokens
+
+    def _generate(self, **kwargs) -> str:
+        """Generate response using the local HuggingFace model.
+        
+        Args:
+            **kwargs: Keyword arguments containing messages and model info
+            
+        Returns:
+            Generated text response
+        """
+        model_name, hf_messages, max_new_tokens = self._prepare(**kwargs)
         
         # Delegate to model handler
         handler = self._get_handler(model_name)
@@ -137,12 +224,8 @@ class HuggingFaceLocalAdapter(CustomLLM):
         Returns:
             ModelResponse with generated text
         """
-        # Run _generate in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        generated_text = await loop.run_in_executor(
-            self._executor, 
-            functools.partial(self._generate, **kwargs)
-        )
+        # Batched with concurrent requests and run in the thread pool to avoid blocking
+        generated_text = await self._runner.submit(*self._prepare(**kwargs))
         
         return await acompletion(
             model=f"huggingface-local/{kwargs['model']}",
@@ -174,12 +257,8 @@ class HuggingFaceLocalAdapter(CustomLLM):
         Returns:
             AsyncIterator of GenericStreamingChunk
         """
-        # Run _generate in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        generated_text = await loop.run_in_executor(
-            self._executor, 
-            functools.partial(self._generate, **kwargs)
-        )
+        # Batched with concurrent requests and run in the thread pool to avoid blocking
+        generated_text = await self._runner.submit(*self._prepare(**kwargs))
         
         generic_streaming_chunk: GenericStreamingChunk = {
             "finish_reason": "stop",
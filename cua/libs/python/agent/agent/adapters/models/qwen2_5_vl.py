@@ -73,3 +73,29 @@ class Qwen2_5_VLModel:
             clean_up_tokenization_spaces=False,
         )
         return output_text[0] if output_text else ""
+
+    def generate_batch(self, batch_messages: List[List[Dict[str, Any]]], max_new_tokens: int = 128) -> List[str]:
+        """Generate text for several HF-format conversations in one left-padded forward pass."""
+        assert self.model is not None and self.processor is not None
+        # Decoder-only batching needs left padding so generated tokens line up
+        self.processor.tokenizer.padding_side = "left"
+        inputs = self.processor.apply_chat_template(
+            batch_messages,
+            add_generation_prompt=True,
+            tokenize=True,
+            return_dict=True,
+            return_tensors="pt",
+            padding=True,
+        )
+        inputs = inputs.to(self.model.device)
+        with torch.no_grad():
+            # Same generation settings as generate() so batched and single outputs match
+            generated_ids = self.model.generate(**inputs, max_new_tokens=max_new_tokens)
+        generated_ids_trimmed = [
+            out_ids[len(in_ids):] for in_ids, out_ids in zip(inputs.input_ids, generated_ids)
+        ]
+        return self.processor.batch_decode(
+            generated_ids_trimmed,
+            skip_special_tokens=True,
+            clean_up_tokenization_spaces=False,
+        )
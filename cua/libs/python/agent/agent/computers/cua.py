@@ -2,11 +2,19 @@
 Computer handler implementation for OpenAI computer-use-preview protocol.
 """
 
+import asyncio
 import base64
 from typing import Dict, List, Any, Literal, Union, Optional
 from .base import AsyncComputerHandler
 from computer import Computer
 
+# Optional SIMD base64 codec (libbase64); releases the GIL while encoding
+try:
+    from pybase64 import b64encode_as_string
+except ImportError:
+    def b64encode_as_string(data: bytes) -> str:
+        return base64.b64encode(data).decode('utf-8')
+
 class cuaComputerHandler(AsyncComputerHandler):
     """Computer handler that implements the Computer protocol using the computer interface."""
     
@@ -37,7 +45,8 @@ class cuaComputerHandler(AsyncComputerHandler):
         """Take a screenshot and return as base64 string."""
         assert self.interface is not None
         screenshot_bytes = await self.interface.screenshot()
-        return base64.b64encode(screenshot_bytes).decode('utf-8')
+        # Multi-megabyte PNGs: encode off the event loop
+        return await asyncio.to_thread(b64encode_as_string, screenshot_bytes)
     
     async def click(self, x: int, y: int, button: str = "left") -> None:
         """Click at coordinates with specified button."""
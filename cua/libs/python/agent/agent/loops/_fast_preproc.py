@@ -0,0 +1,54 @@
+"""
+Fused CPU screenshot preprocessing for the Qwen2.5-VL based grounding loops.
+
+One numba kernel rescales, normalizes and patchifies a uint8 HWC frame straight into
+the flattened patch layout the vision tower consumes, instead of the image processor's
+separate float conversion, normalize, transpose and reshape passes. Only used when numba
+(and therefore numpy) is installed; the image processor handles preprocessing otherwise.
+"""
+
+try:
+    import numpy as np
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, nogil=True, parallel=True, fastmath=True)
+def normalize_patchify(img, mean, std, temporal, patch, merge, out):
+    """Write ``(img / 255 - mean) / std`` for an (H, W, C) uint8 frame into ``out`` as patches.
+
+    ``out`` must hold at least (H // patch) * (W // patch) rows of C * temporal * patch * patch
+    float32 values. Rows follow the Qwen2.5-VL order (merge blocks row-major, then the
+    merge x merge patches inside each block); each row is laid out channel, temporal copy,
+    patch row, patch column. H and W must be multiples of patch * merge.
+    """
+    height, width, channel = img.shape
+    grid_w = width // patch
+    blocks_w = grid_w // merge
+    rows = (height // patch) * grid_w
+    for row in prange(rows):
+        merge_w = row % merge
+        rest = row // merge
+        merge_h = rest % merge
+        rest = rest // merge
+        block_w = rest % blocks_w
+        block_h = rest // blocks_w
+        y0 = (block_h * merge + merge_h) * patch
+        x0 = (block_w * merge + merge_w) * patch
+        col = 0
+        for c in range(channel):
+            scale = np.float32(1.0 / (255.0 * std[c]))
+            offset = np.float32(mean[c] / std[c])
+            for _ in range(temporal):
+                for ph in range(patch):
+                    for pw in range(patch):
+                        out[row, col] = img[y0 + ph, x0 + pw, c] * scale - offset
+                        col += 1
@@ -0,0 +1,120 @@
+"""
+Bbox parsing and coordinate post-processing shared by the grounding loops.
+
+The kernels are compiled with numba when it is installed (``cache=True`` keeps the
+compiled code on disk between runs, ``nogil=True`` lets them run concurrently from
+executor threads) and fall back to plain Python over ``bytes`` otherwise, so neither
+numba nor numpy is needed to import this module.
+"""
+
+from typing import Tuple
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, nogil=True)
+def postprocess_bbox(x1, y1, x2, y2, src_w, src_h, dst_w, dst_h):
+    """Center of an absolute-pixel bbox predicted on a src_w x src_h image, mapped to dst_w x dst_h.
+
+    Returns (-1, -1) when the center falls outside the source image; otherwise the
+    scaled center, clipped to the destination image.
+    """
+    cx = (x1 + x2) // 2
+    cy = (y1 + y2) // 2
+    if cx < 0 or cy < 0 or cx >= src_w or cy >= src_h:
+        return -1, -1
+    if src_w != dst_w:
+        cx = cx * dst_w // src_w
+    if src_h != dst_h:
+        cy = cy * dst_h // src_h
+    return min(cx, dst_w - 1), min(cy, dst_h - 1)
+
+
+@njit(cache=True, nogil=True)
+def _skip_space(buf, i):
+    n = len(buf)
+    # space, \t, \n, \v, \f, \r
+    while i < n and (buf[i] == 32 or 9 <= buf[i] <= 13):
+        i += 1
+    return i
+
+
+@njit(cache=True, nogil=True)
+def _expect(buf, i, char):
+    """Whether ``char`` follows optional whitespace at ``i``."""
+    i = _skip_space(buf, i)
+    return i < len(buf) and buf[i] == char
+
+
+@njit(cache=True, nogil=True)
+def _scan_number(buf, i):
+    r"""Match ``-?\d+(\.\d*)?`` at ``i``; returns (ok, integer part, index after the match)."""
+    n = len(buf)
+    negative = False
+    if i < n and buf[i] == 45:  # '-'
+        negative = True
+        i += 1
+    start = i
+    value = 0
+    while i < n and 48 <= buf[i] <= 57:
+        value = value * 10 + (int(buf[i]) - 48)
+        i += 1
+    if i == start:
+        return False, 0, i
+    if i < n and buf[i] == 46:  # '.', fractional part is dropped
+        i += 1
+        while i < n and 48 <= buf[i] <= 57:
+            i += 1
+    return True, -value if negative else value, i
+
+
+@njit(cache=True, nogil=True)
+def parse_bbox(buf):
+    r"""Find the first "[x1, y1, x2, y2]" in UTF-8 model output bytes (a uint8 array or ``bytes``).
+
+    Equivalent to searching for ``\[\s*N\s*,\s*N\s*,\s*N\s*,\s*N\s*\]`` with
+    N = ``-?\d+(\.\d*)?``, keeping the integer parts. Returns (found, x1, y1, x2, y2).
+    """
+    n = len(buf)
+    for start in range(n):
+        if buf[start] != 91:  # '['
+            continue
+        i = _skip_space(buf, start + 1)
+        ok, x1, i = _scan_number(buf, i)
+        if not ok or not _expect(buf, i, 44):  # ','
+            continue
+        ok, y1, i = _scan_number(buf, _skip_space(buf, _skip_space(buf, i) + 1))
+        if not ok or not _expect(buf, i, 44):
+            continue
+        ok, x2, i = _scan_number(buf, _skip_space(buf, _skip_space(buf, i) + 1))
+        if not ok or not _expect(buf, i, 44):
+            continue
+        ok, y2, i = _scan_number(buf, _skip_space(buf, _skip_space(buf, i) + 1))
+        if not ok or not _expect(buf, i, 93):  # ']'
+            continue
+        return True, x1, y1, x2, y2
+    return False, 0, 0, 0, 0
+
+
+def parse_bbox_text(text: str) -> Tuple[bool, int, int, int, int]:
+    """``parse_bbox`` over a Python string."""
+    data = text.encode("utf-8")
+    if NUMBA_AVAILABLE:
+        return parse_bbox(np.frombuffer(data, dtype=np.uint8))
+    return parse_bbox(data)
+
+
+def warmup() -> Tuple[int, int]:
+    """Compile (or load from the on-disk cache) the kernels ahead of the first real call."""
+    parse_bbox_text("[0,0,2,2]")
+    return postprocess_bbox(0, 0, 2, 2, 4, 4, 8, 8)
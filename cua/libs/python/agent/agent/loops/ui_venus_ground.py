@@ -5,24 +5,174 @@ This agent loop uses the UIVenusGroundModel to provide grounding functionality
 for UI-Venus-Ground models.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
-import base64
+from typing import List, Dict, Any, Optional, Tuple, Union
+import asyncio
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import hashlib
+import importlib.util
+import os
+import re
+import tempfile
+import threading
+import warnings
 from io import BytesIO
 from PIL import Image
 
 # Hugging Face imports are local to avoid hard dependency at module import
 try:
+    import numpy as np
     import torch
     from transformers import Qwen2_5_VLForConditionalGeneration, AutoTokenizer, AutoProcessor
-    from qwen_vl_utils import process_vision_info
+    from qwen_vl_utils import process_vision_info, smart_resize
     HF_AVAILABLE = True
 except Exception:
     HF_AVAILABLE = False
 
+# Optional GPU image preprocessing (resize/normalize) for the vision tower input
+try:
+    from torchvision.io import ImageReadMode, decode_jpeg
+    from torchvision.transforms import InterpolationMode
+    from torchvision.transforms.v2 import functional as TF
+    TORCHVISION_AVAILABLE = True
+except Exception:
+    TORCHVISION_AVAILABLE = False
+
+# Optional libjpeg-turbo decoder for JPEG screenshots. PNG decoding goes through Pillow;
+# installing pillow-simd (`pip install pillow-simd`) replaces Pillow transparently and
+# speeds up PNG unpacking with SSE4/AVX2.
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _TURBOJPEG = TurboJPEG()
+except Exception:
+    _TURBOJPEG = None
+
+# Optional SIMD base64 codec (libbase64) for decoding screenshots
+try:
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
+JPEG_MAGIC = b"\xff\xd8\xff"
+PNG_MAGIC = b"\x89PNG"
+
 # Agent loop imports
 from ..decorators import register_agent
 from ..types import AgentCapability
 from .base import AsyncAgentConfig
+from . import _fast_preproc, _grounding_postprocess
+from ._grounding_postprocess import parse_bbox_text, postprocess_bbox
+
+logger = logging.getLogger(__name__)
+
+PROMPT_TEMPLATE = 'Outline the position corresponding to the instruction: {}. The output should be only [x1,y1,x2,y2].'
+
+
+# "?quant=..." model id suffix -> UIVenusGroundModel quantization_scheme
+_QUANT_SUFFIXES = {
+    "int8": "bnb8",
+    "bnb8": "bnb8",
+    "nf4": "bnb4",
+    "int4": "bnb4",
+    "bnb4": "bnb4",
+    "awq": "awq",
+    "gptq": "gptq",
+}
+
+# (model input width, height, original width, height) used to map a bbox back to the screenshot
+Geometry = Tuple[int, int, int, int]
+
+# Number of (instruction, screenshot) -> raw bbox results kept per model instance
+BBOX_CACHE_SIZE = 256
+
+# Number of decoded + resized screenshots kept per model instance (a few MB each)
+FIT_CACHE_SIZE = 4
+
+# Screen size used to warm up a compiled vision tower (the default CUA container desktop)
+WARMUP_SCREEN_SIZE = (1024, 768)
+
+# Number of screenshots whose GPU pixel_values stay resident (tens of MB each)
+PIXEL_CACHE_SIZE = 2
+
+# Micro-batching of concurrent predict_click calls: max requests per forward pass and
+# how long (seconds) to wait for more requests after the first one arrives
+BATCH_MAX_SIZE = 8
+BATCH_TIMEOUT = 0.008
+
+# Approximate weight bytes per parameter for each quantization scheme (None = fp16/bf16)
+_BYTES_PER_PARAM = {None: 2.0, "bnb8": 1.0, "bnb4": 0.5, "awq": 0.5, "gptq": 0.5}
+# Headroom for activations, the vision tower and the KV cache on top of the weights
+VRAM_OVERHEAD = 1.2
+# Fraction of free GPU memory a model may claim
+VRAM_BUDGET = 0.9
+
+
+def _estimate_vram(model_name: str, scheme: Optional[str]) -> Optional[int]:
+    """Rough VRAM (bytes) needed to load a checkpoint, from the parameter count in its name.
+
+    e.g. "inclusionAI/UI-Venus-Ground-72B" -> 72e9 params. Returns None when the name
+    carries no size.
+    """
+    match = re.search(r"(\d+(?:\.\d+)?)[Bb](?![a-zA-Z])", model_name.split("/")[-1])
+    if match is None:
+        return None
+    return int(float(match.group(1)) * 1e9 * _BYTES_PER_PARAM[scheme] * VRAM_OVERHEAD)
+
+
+def _pick_quantization(model_name: str, scheme: Optional[str]) -> Optional[str]:
+    """Quantize an unquantized load on the fly (INT8, then NF4) when it would not fit free VRAM.
+
+    An explicitly requested scheme is kept as is. Raises MemoryError up front when the
+    model fits in no available precision (without bitsandbytes, only 16-bit is available).
+    """
+    if scheme is not None or not torch.cuda.is_available():
+        return scheme
+    free = sum(torch.cuda.mem_get_info(i)[0] for i in range(torch.cuda.device_count()))
+    budget = free * VRAM_BUDGET
+    needed = _estimate_vram(model_name, None)
+    if needed is None or needed < budget:
+        return scheme
+    if importlib.util.find_spec("bitsandbytes") is None:
+        raise MemoryError(
+            f"{model_name} needs ~{needed / 1e9:.1f} GB in 16-bit but only {free / 1e9:.1f} GB "
+            f"of VRAM is free; install bitsandbytes (pip install bitsandbytes) to load it in 8 or 4 bits"
+        )
+    for candidate in ("bnb8", "bnb4"):
+        if _estimate_vram(model_name, candidate) < budget:
+            logger.warning(
+                "%s needs ~%.1f GB in 16-bit but only %.1f GB of VRAM is free; loading with %s",
+                model_name, needed / 1e9, free / 1e9, candidate,
+            )
+            return candidate
+    raise MemoryError(
+        f"{model_name} needs ~{_estimate_vram(model_name, 'bnb4') / 1e9:.1f} GB even in 4-bit, "
+        f"but only {free / 1e9:.1f} GB of VRAM is free"
+    )
+
+
+def _image_payload(image: Union[str, bytes]) -> bytes:
+    """Return raw encoded image bytes from a base64 string/data URL or raw PNG/JPEG bytes.
+
+    In-process callers can pass the screenshot bytes straight through and skip the
+    base64 encode/decode round trip.
+    """
+    if isinstance(image, (bytes, bytearray, memoryview)):
+        image = bytes(image)
+        if image[:4] == PNG_MAGIC or image[:3] == JPEG_MAGIC:
+            return image
+        image = image.decode("utf-8", errors="ignore")
+    if image.startswith("data:image"):
+        image = image.split(",")[-1]
+    return b64decode(image)
+
+def _decode_image(image_data: bytes) -> Image.Image:
+    """Decode screenshot bytes into an RGB PIL image, using TurboJPEG for JPEG payloads."""
+    if _TURBOJPEG is not None and image_data[:3] == JPEG_MAGIC:
+        return Image.fromarray(_TURBOJPEG.decode(image_data, pixel_format=TJPF_RGB))
+    image = Image.open(BytesIO(image_data))
+    return image if image.mode == "RGB" else image.convert("RGB")
 
 
 class UIVenusGroundModel:
@@ -32,7 +182,29 @@ class UIVenusGroundModel:
     for the described UI element.
     """
 
-    def __init__(self, model_name: str, device: str = "auto", trust_remote_code: bool = False, quantization_bits: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        model_name: str,
+        device: str = "auto",
+        trust_remote_code: bool = False,
+        quantization_bits: Optional[int] = None,
+        quantization_scheme: Optional[str] = None,
+        min_pixels: int = 1_000_000,
+        max_pixels: int = 2_000_000,
+    ) -> None:
+        """
+        Args:
+            model_name: Hugging Face model ID or local path
+            device: Device map passed to ``from_pretrained``
+            trust_remote_code: Whether to trust remote code
+            quantization_bits: Legacy bitsandbytes switch (8 or 4); ignored if ``quantization_scheme`` is set
+            quantization_scheme: One of ``"awq"``, ``"gptq"`` (prequantized INT4 weights, e.g.
+                ``UI-Venus-Ground-7B-AWQ``), or ``"bnb8"`` (LLM.int8()) / ``"bnb4"`` (NF4, bf16
+                compute) quantized on load by bitsandbytes
+            min_pixels: Lower pixel budget for the screenshot fed to the vision tower
+            max_pixels: Upper pixel budget; larger screenshots are downscaled once on CPU
+                and predicted coordinates are mapped back to the original resolution
+        """
         if not HF_AVAILABLE:
             raise ImportError(
                 "Required dependencies not found. Install with: pip install transformers torch qwen-vl-utils bitsandbytes accelerate"
@@ -41,9 +213,33 @@ class UIVenusGroundModel:
         self.device = device
         self.trust_remote_code = trust_remote_code
         self.quantization_bits = quantization_bits
+        if quantization_scheme is None and quantization_bits in (4, 8):
+            quantization_scheme = f"bnb{quantization_bits}"
+        self.quantization_scheme = quantization_scheme.lower() if quantization_scheme else None
+        self.min_pixels = min_pixels
+        self.max_pixels = max_pixels
         self.model = None
         self.tokenizer = None
         self.processor = None
+        # (instruction, screenshot hash) -> (raw bbox string, geometry)
+        self._bbox_cache: "OrderedDict[Tuple[str, str], Tuple[str, Geometry]]" = OrderedDict()
+        # Guards _bbox_cache, which predictions on several pool threads read and update
+        self._bbox_lock = threading.Lock()
+        # screenshot sha1 -> (image at model input size, geometry back to original pixels)
+        self._fit_cache: "OrderedDict[str, Tuple[Image.Image, Geometry]]" = OrderedDict()
+        # Guards _fit_cache, which prefetch_images fills from another executor thread
+        self._fit_lock = threading.Lock()
+        # screenshot sha1 -> (pixel_values on device, image_grid_thw row), direct preprocessing only
+        self._pixel_cache: "OrderedDict[str, Tuple[torch.Tensor, List[int]]]" = OrderedDict()
+        # Pinned host staging buffers (grown on demand) and a side stream for H2D copies
+        self._pinned: Dict[str, "torch.Tensor"] = {}
+        self._copy_stream = None
+        self._copy_done = None
+        self._frame_done = None
+        self._gpu_preprocess = False
+        self._cpu_preprocess = False
+        # Reusable float32 output buffer for the fused CPU preprocessing kernel
+        self._preproc_out: Optional[np.ndarray] = None
         self.generation_config = {
             "max_new_tokens": 2048,
             "do_sample": False
@@ -60,99 +256,391 @@ class UIVenusGroundModel:
             "attn_implementation": "flash_attention_2"
         }
 
-        if self.quantization_bits == 8:
+        if self.device != "cpu":
+            self.quantization_scheme = _pick_quantization(self.model_name, self.quantization_scheme)
+        scheme = self.quantization_scheme
+        if scheme in ("awq", "gptq"):
             if not torch.cuda.is_available():
-                raise ImportError("8-bit quantization is only available with CUDA.")
-            load_params["load_in_8bit"] = True
+                raise ImportError(f"{scheme.upper()} quantization is only available with CUDA.")
+            # Prequantized INT4 weight-only checkpoints: the quantization_config shipped with
+            # the weights selects the fused dequant+GEMM kernels, no LLM.int8() outlier split.
+            load_params["torch_dtype"] = torch.float16
             load_params["device_map"] = "auto"
-        elif self.quantization_bits == 4:
+            if scheme == "gptq":
+                from transformers import GPTQConfig
+                load_params["quantization_config"] = GPTQConfig(bits=4, use_exllama=True)
+        elif scheme in ("bnb8", "bnb4"):
             if not torch.cuda.is_available():
-                 raise ImportError("4-bit quantization is only available with CUDA.")
-            load_params["load_in_4bit"] = True
+                raise ImportError(f"{scheme[-1]}-bit quantization is only available with CUDA.")
+            from transformers import BitsAndBytesConfig
+            # Only the language model is quantized: the vision tower is small next to the LM
+            # and stays in bf16 (it is what localizes the element).
+            if scheme == "bnb8":
+                load_params["quantization_config"] = BitsAndBytesConfig(
+                    load_in_8bit=True,
+                    llm_int8_skip_modules=["visual", "lm_head"],
+                )
+            else:
+                load_params["quantization_config"] = BitsAndBytesConfig(
+                    load_in_4bit=True,
+                    bnb_4bit_quant_type="nf4",
+                    bnb_4bit_compute_dtype=torch.bfloat16,
+                    bnb_4bit_use_double_quant=True,
+                    llm_int8_skip_modules=["visual", "lm_head"],
+                )
+            load_params["torch_dtype"] = torch.bfloat16
             load_params["device_map"] = "auto"
-        else:
+        elif scheme is None:
             load_params["torch_dtype"] = dtype
             load_params["device_map"] = self.device
+        else:
+            raise ValueError(
+                f"Unsupported quantization_scheme: {scheme!r} (expected 'awq', 'gptq', 'bnb8' or 'bnb4')"
+            )
 
         self.model = Qwen2_5_VLForConditionalGeneration.from_pretrained(
                         self.model_name,
                         **load_params
                     ).eval()
 
+        # Opt-in (CUA_TORCH_COMPILE=1): cut per-token Python/CUDA dispatch overhead and compile
+        # the vision tower that encodes every new screenshot. The decode step is not compiled
+        # by hand: with the default DynamicCache its shapes change every token and CUDA graphs
+        # would be re-recorded. A static KV cache keeps them fixed, and generate() then
+        # compiles the decode forward itself. The vision tower is warmed up below.
+        compile_model = os.getenv("CUA_TORCH_COMPILE") == "1" and self.model.device.type == "cuda"
+        if compile_model:
+            self.model.generation_config.cache_implementation = "static"
+            # Newer transformers keep the tower on the inner model and expose a read-only alias
+            inner = getattr(self.model, "model", None)
+            self._visual_owner = inner if hasattr(inner, "visual") else self.model
+            self._visual_owner.visual = torch.compile(
+                self._visual_owner.visual, mode="reduce-overhead", fullgraph=False
+            )
+
         # Load tokenizer and processor
         self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, trust_remote_code=self.trust_remote_code)
-        # Use slow processor to avoid the fast processor warning
-        self.processor = AutoProcessor.from_pretrained(self.model_name, use_fast=False)
+        # Fast (Rust tokenizer + Qwen2VLImageProcessorFast) processor
+        with warnings.catch_warnings():
+            # The fast image processor's output-difference notice is cosmetic for grounding
+            warnings.filterwarnings("ignore", message=".*fast image processor.*")
+            self.processor = AutoProcessor.from_pretrained(
+                self.model_name, use_fast=True, trust_remote_code=self.trust_remote_code
+            )
+        # The rendered chat template only depends on the instruction text (the image is a
+        # placeholder token), so memoize it per instance.
+        self._template_for = lru_cache(maxsize=256)(self._render_template)
+        # Decoder-only batching needs left padding so generated tokens line up
+        self.processor.tokenizer.padding_side = "left"
+        # Build pixel_values on the GPU instead of through the CPU image processor
+        self._gpu_preprocess = TORCHVISION_AVAILABLE and self.model.device.type == "cuda"
+        # Otherwise build them with one fused numba pass when available
+        self._cpu_preprocess = not self._gpu_preprocess and _fast_preproc.NUMBA_AVAILABLE
+        image_processor = self.processor.image_processor
+        self._image_mean = np.asarray(image_processor.image_mean, dtype=np.float32)
+        self._image_std = np.asarray(image_processor.image_std, dtype=np.float32)
+        # Compile the coordinate (and preprocessing) kernels now rather than on the first click
+        _grounding_postprocess.warmup()
+        if self._cpu_preprocess:
+            self._preprocess_image_cpu(Image.new("RGB", (28, 28)))
+        if compile_model:
+            self._warmup_visual()
 
-    def generate(self, messages: List[Dict[str, Any]], max_new_tokens: int = 128) -> str:
-        """Generate text for the given HF-format messages.
+    def _warmup_visual(self) -> None:
+        """Run the compiled vision tower once so compilation happens at load, not on the first click."""
+        width, height = WARMUP_SCREEN_SIZE
+        inputs = self.processor.image_processor(
+            images=Image.new("RGB", (width, height)),
+            min_pixels=self.min_pixels,
+            max_pixels=self.max_pixels,
+            return_tensors="pt",
+        )
+        with torch.no_grad():
+            self._visual_owner.visual(
+                inputs["pixel_values"].to(self.model.device, dtype=self.model.dtype),
+                grid_thw=inputs["image_grid_thw"].to(self.model.device),
+            )
 
-        For UI grounding, we expect messages to contain an image and instruction.
-        Returns bounding box coordinates in format: [x1,y1,x2,y2]
+    def _to_device(self, model_inputs):
+        """Move processor outputs to the model device.
+
+        On CUDA the tensors are staged through reusable pinned host buffers and copied
+        with ``non_blocking=True`` on a dedicated stream, avoiding a fresh pageable
+        allocation and a synchronous copy for the (tens of MB) pixel tensor per call.
         """
-        assert self.model is not None and self.processor is not None
+        device = self.model.device
+        if device.type != "cuda":
+            return model_inputs.to(device)
 
-        # Extract instruction and image from messages
-        instruction = ""
-        image_path = None
+        if self._copy_stream is None:
+            self._copy_stream = torch.cuda.Stream(device=device)
+        # The previous transfer must finish reading the staging buffers before reuse
+        if self._copy_done is not None:
+            self._copy_done.synchronize()
 
-        for message in messages:
-            if message.get("role") == "user":
-                content = message.get("content", [])
-                for item in content:
-                    if item.get("type") == "text":
-                        instruction = item.get("text", "")
-                    elif item.get("type") == "image":
-                        image_path = item.get("image", "")
+        compute_stream = torch.cuda.current_stream(device)
+        with torch.cuda.stream(self._copy_stream):
+            for name, tensor in list(model_inputs.items()):
+                if not isinstance(tensor, torch.Tensor):
+                    continue
+                staging = self._pinned.get(name)
+                if staging is None or staging.dtype != tensor.dtype or staging.numel() < tensor.numel():
+                    staging = torch.empty(tensor.numel(), dtype=tensor.dtype, pin_memory=True)
+                    self._pinned[name] = staging
+                staging = staging[:tensor.numel()].view(tensor.shape)
+                staging.copy_(tensor)
+                moved = staging.to(device, non_blocking=True)
+                moved.record_stream(compute_stream)
+                model_inputs[name] = moved
+            self._copy_done = torch.cuda.Event()
+            self._copy_done.record(self._copy_stream)
+        compute_stream.wait_stream(self._copy_stream)
+        return model_inputs
+
+    def _upload_frame(self, image: Image.Image) -> "torch.Tensor":
+        """Copy a decoded RGB frame into a reusable pinned buffer and DMA it to the GPU.
+
+        ``np.asarray`` views PIL's pixel buffer instead of making another full-frame copy,
+        and the single copy into the pinned pool lets the upload run asynchronously.
+        """
+        frame = np.asarray(image)
+        # The previous upload must finish reading the staging buffer before reuse
+        if self._frame_done is not None:
+            self._frame_done.synchronize()
+        staging = self._pinned.get("frame")
+        if staging is None or staging.numel() < frame.size:
+            staging = torch.empty(frame.size, dtype=torch.uint8, pin_memory=True)
+            self._pinned["frame"] = staging
+        staging = staging[:frame.size].view(frame.shape)
+        staging.numpy()[...] = frame
+        pixels = staging.to(self.model.device, non_blocking=True)
+        self._frame_done = torch.cuda.Event()
+        self._frame_done.record()
+        return pixels
+
+    def _decode_on_gpu(self, image: Image.Image) -> Optional["torch.Tensor"]:
+        """Decode a lazily opened JPEG screenshot with nvJPEG straight into a (C, H, W) uint8 GPU tensor.
+
+        Only the compressed bytes cross PCIe. Returns None for anything else (or if nvJPEG
+        fails), in which case the caller uploads PIL's decoded pixels instead.
+        """
+        encoded = image.info.get("encoded")
+        if encoded is None:
+            return None
+        try:
+            data = torch.frombuffer(bytearray(encoded), dtype=torch.uint8)
+            return decode_jpeg(data, mode=ImageReadMode.RGB, device=self.model.device)
+        except Exception:
+            logger.debug("GPU JPEG decode failed, decoding on CPU", exc_info=True)
+            return None
+
+    def _preprocess_image(self, image: Image.Image) -> Tuple["torch.Tensor", List[int]]:
+        """Resize, normalize and patchify one screenshot on the GPU.
+
+        Produces the same flattened (grid_h * grid_w, C * T * P * P) patch layout and
+        [t, h, w] grid as the Qwen2.5-VL image processor.
+        """
+        image_processor = self.processor.image_processor
+        patch = image_processor.patch_size
+        merge = image_processor.merge_size
+        temporal = image_processor.temporal_patch_size
+
+        width, height = image.size
+        resized_h, resized_w = smart_resize(
+            height, width, factor=patch * merge, min_pixels=self.min_pixels, max_pixels=self.max_pixels
+        )
 
-        if not instruction or not image_path:
-            return "[0,0,0,0]"  # Return empty bbox if missing data
+        pixels = self._decode_on_gpu(image)
+        if pixels is None:
+            pixels = self._upload_frame(image).permute(2, 0, 1)
+        if (resized_w, resized_h) != (width, height):
+            # BICUBIC like the image processor and _fit_image, so every path sees the same pixels
+            pixels = TF.resize(
+                pixels, [resized_h, resized_w], interpolation=InterpolationMode.BICUBIC, antialias=True
+            )
+        pixels = TF.to_dtype(pixels, torch.float32, scale=True)
+        pixels = TF.normalize(pixels, mean=list(image_processor.image_mean), std=list(image_processor.image_std))
+
+        channel = pixels.shape[0]
+        grid_h, grid_w = resized_h // patch, resized_w // patch
+        # A still image is repeated along the temporal patch axis
+        patches = pixels.unsqueeze(0).expand(temporal, -1, -1, -1)
+        patches = patches.reshape(1, temporal, channel, grid_h // merge, merge, patch, grid_w // merge, merge, patch)
+        patches = patches.permute(0, 3, 6, 4, 7, 2, 1, 5, 8)
+        flat = patches.reshape(grid_h * grid_w, channel * temporal * patch * patch)
+        return flat.to(self.model.dtype), [1, grid_h, grid_w]
+
+    def _preprocess_image_cpu(self, image: Image.Image) -> Tuple["torch.Tensor", List[int]]:
+        """Normalize and patchify one fitted screenshot on the CPU in a single fused pass.
+
+        Same output as ``_preprocess_image``; the numba kernel writes straight into a
+        float32 buffer that is reused across calls.
+        """
+        image_processor = self.processor.image_processor
+        patch = image_processor.patch_size
+        merge = image_processor.merge_size
+        temporal = image_processor.temporal_patch_size
+
+        width, height = image.size
+        resized_h, resized_w = smart_resize(
+            height, width, factor=patch * merge, min_pixels=self.min_pixels, max_pixels=self.max_pixels
+        )
+        # _fit_image already resized to this size; only foreign images get resized here
+        if (resized_w, resized_h) != (width, height):
+            image = image.resize((resized_w, resized_h), Image.Resampling.BICUBIC)
+        frame = np.asarray(image if image.mode == "RGB" else image.convert("RGB"))
 
-        # Prepare the prompt
-        prompt_origin = 'Outline the position corresponding to the instruction: {}. The output should be only [x1,y1,x2,y2].'
-        full_prompt = prompt_origin.format(instruction)
+        grid_h, grid_w = resized_h // patch, resized_w // patch
+        rows, cols = grid_h * grid_w, frame.shape[2] * temporal * patch * patch
+        if self._preproc_out is None or self._preproc_out.size < rows * cols:
+            self._preproc_out = np.empty(rows * cols, dtype=np.float32)
+        out = self._preproc_out[:rows * cols].reshape(rows, cols)
+        _fast_preproc.normalize_patchify(frame, self._image_mean, self._image_std, temporal, patch, merge, out)
+        # copy=True: the buffer is reused by the next call
+        flat = torch.from_numpy(out).to(self.model.device, dtype=self.model.dtype, copy=True)
+        return flat, [1, grid_h, grid_w]
 
-        # Set image processing parameters
-        min_pixels = 2000000
-        max_pixels = 4800000
+    def _cached_pixels(self, image: Image.Image) -> Tuple["torch.Tensor", List[int]]:
+        """Vision-tower input for a fitted screenshot, reused across instructions on it."""
+        preprocess = self._preprocess_image if self._gpu_preprocess else self._preprocess_image_cpu
+        digest = image.info.get("sha1")
+        if digest is None:
+            return preprocess(image)
+        cached = self._pixel_cache.get(digest)
+        if cached is not None:
+            self._pixel_cache.move_to_end(digest)
+            return cached
+        cached = preprocess(image)
+        self._pixel_cache[digest] = cached
+        if len(self._pixel_cache) > PIXEL_CACHE_SIZE:
+            self._pixel_cache.popitem(last=False)
+        return cached
 
-        # Prepare messages for Qwen model
+    def _build_inputs(self, texts: List[str], images: List[Image.Image]):
+        """Tokenize the prompts and attach directly built pixel_values / image_grid_thw."""
+        merge = self.processor.image_processor.merge_size
+        image_token = getattr(self.processor, "image_token", "<|image_pad|>")
+
+        pixel_values = []
+        grids = []
+        expanded = []
+        for text, image in zip(texts, images):
+            flat, grid = self._cached_pixels(image)
+            pixel_values.append(flat)
+            grids.append(grid)
+            # One placeholder token per merged patch, as the processor would expand it
+            num_tokens = grid[0] * grid[1] * grid[2] // (merge * merge)
+            expanded.append(text.replace(image_token, image_token * num_tokens, 1))
+
+        model_inputs = self.processor.tokenizer(expanded, padding=True, return_tensors="pt")
+        model_inputs = self._to_device(model_inputs)
+        model_inputs["pixel_values"] = torch.cat(pixel_values)
+        model_inputs["image_grid_thw"] = torch.tensor(grids, device=self.model.device)
+        return model_inputs
+
+    def _render_template(self, instruction: str) -> str:
+        """Render the chat template for an instruction without tokenizing."""
         messages = [
             {
                 "role": "user",
                 "content": [
-                    {
-                        "type": "image",
-                        "image": image_path,
-                        "min_pixels": min_pixels,
-                        "max_pixels": max_pixels
-                    },
-                    {"type": "text", "text": full_prompt},
+                    {"type": "image"},
+                    {"type": "text", "text": PROMPT_TEMPLATE.format(instruction)},
                 ],
             }
         ]
-
-        # Apply chat template and tokenize
-        text = self.processor.apply_chat_template(
+        return self.processor.apply_chat_template(
             messages, tokenize=False, add_generation_prompt=True
         )
-        image_inputs, video_inputs = process_vision_info(messages)
-        model_inputs = self.processor(
-            text=[text],
-            images=image_inputs,
-            videos=video_inputs,
-            padding=True,
-            return_tensors="pt"
-        ).to(self.model.device)
+
+    @staticmethod
+    def _extract_request(messages: List[Dict[str, Any]]) -> Tuple[str, Any]:
+        """Pull the (instruction, image) pair out of HF-format messages."""
+        instruction = ""
+        image = None
+
+        for message in messages:
+            if message.get("role") == "user":
+                content = message.get("content", [])
+                for item in content:
+                    if item.get("type") == "text":
+                        instruction = item.get("text", "")
+                    elif item.get("type") == "image":
+                        image = item.get("image")
+
+        return instruction, image
+
+    def generate(self, messages: List[Dict[str, Any]], max_new_tokens: int = 128) -> Optional[str]:
+        """Generate text for the given HF-format messages.
+
+        For UI grounding, we expect messages to contain an image and instruction.
+        Returns bounding box coordinates in format: [x1,y1,x2,y2], or None when
+        either is missing.
+        """
+        return self.generate_batch([messages])[0]
+
+    def generate_batch(self, batch_messages: List[List[Dict[str, Any]]]) -> List[Optional[str]]:
+        """Generate bounding boxes for several HF-format message lists in one forward pass.
+
+        Prompts are left-padded into a single batch. Entries missing an instruction or
+        image get None without being sent to the model.
+        """
+        assert self.model is not None and self.processor is not None
+
+        outputs: List[Optional[str]] = [None] * len(batch_messages)
+
+        indices: List[int] = []
+        texts: List[str] = []
+        images: List[Any] = []
+        vision_messages: List[Dict[str, Any]] = []
+        for idx, messages in enumerate(batch_messages):
+            instruction, image = self._extract_request(messages)
+            if not instruction or not image:
+                continue  # No prediction if missing data
+            indices.append(idx)
+            # Apply chat template (cached per instruction)
+            texts.append(self._template_for(instruction))
+            images.append(image)
+            # Prepare messages for Qwen model
+            vision_messages.append(
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "image",
+                            "image": image,
+                            "min_pixels": self.min_pixels,
+                            "max_pixels": self.max_pixels
+                        },
+                    ],
+                }
+            )
+
+        if not indices:
+            return outputs
+
+        # Tokenize
+        if (self._gpu_preprocess or self._cpu_preprocess) and all(isinstance(image, Image.Image) for image in images):
+            model_inputs = self._build_inputs(texts, images)
+        else:
+            image_inputs, video_inputs = process_vision_info(vision_messages)
+            model_inputs = self.processor(
+                text=texts,
+                images=image_inputs,
+                videos=video_inputs,
+                padding=True,
+                return_tensors="pt"
+            )
+            model_inputs = self._to_device(model_inputs)
 
         # Generate response
         with torch.no_grad():
             generated_ids = self.model.generate(**model_inputs, **self.generation_config)
 
-        # Trim prompt tokens from output
+        # Trim prompt tokens from output (left padding keeps prompts aligned)
         generated_ids_trimmed = [
             out_ids[len(in_ids):]
-            for in_ids, out_ids in zip(model_inputs.input_ids, generated_ids)
+            for in_ids, out_ids in zip(model_inputs["input_ids"], generated_ids)
         ]
 
         # Decode
@@ -160,92 +648,322 @@ class UIVenusGroundModel:
             generated_ids_trimmed, skip_special_tokens=True, clean_up_tokenization_spaces=False
         )
 
-        return output_text[0] if output_text else "[0,0,0,0]"
+        for idx, text in zip(indices, output_text):
+            outputs[idx] = text
+        return outputs
+
+    def _fit_image(self, image: Image.Image) -> Tuple[Image.Image, Geometry]:
+        """Resize the screenshot to the exact size the processor would pick.
+
+        Doing this once up front (instead of inside the processor) lets us map the predicted
+        coordinates back by the known ratio. With GPU preprocessing the resize itself is
+        left to ``_preprocess_image``, which targets the same size. Returns the image and
+        (resized_w, resized_h, orig_w, orig_h).
+        """
+        image_processor = self.processor.image_processor
+        orig_w, orig_h = image.size
+        resized_h, resized_w = smart_resize(
+            orig_h,
+            orig_w,
+            factor=image_processor.patch_size * image_processor.merge_size,
+            min_pixels=self.min_pixels,
+            max_pixels=self.max_pixels,
+        )
+        geometry = (resized_w, resized_h, orig_w, orig_h)
+        if (resized_w, resized_h) == (orig_w, orig_h):
+            return image, geometry
+        if not self._gpu_preprocess:
+            # Same resampling as the Qwen2.5-VL image processor
+            image = image.resize((resized_w, resized_h), Image.Resampling.BICUBIC)
+        return image, geometry
+
+    def _open_image(self, image_data: bytes) -> Image.Image:
+        """Decode screenshot bytes, deferring JPEG decoding to the GPU when preprocessing runs there."""
+        if self._gpu_preprocess and image_data[:3] == JPEG_MAGIC:
+            # Header only: the size is all _fit_image needs; pixels are decoded by nvJPEG in
+            # _preprocess_image (PIL still decodes lazily if anything else touches them)
+            image = Image.open(BytesIO(image_data))
+            if image.mode == "RGB":
+                image.info["encoded"] = image_data
+                return image
+        return _decode_image(image_data)
+
+    def _fitted_image(self, image_data: bytes, digest: str) -> Tuple[Image.Image, Geometry]:
+        """Decode and fit a screenshot, reusing the result for recently seen screenshots."""
+        with self._fit_lock:
+            fitted = self._fit_cache.get(digest)
+            if fitted is not None:
+                self._fit_cache.move_to_end(digest)
+                return fitted
+        image = self._open_image(image_data)
+        logger.debug("   📏 Image size: %s", image.size)
+        fitted = self._fit_image(image)
+        # Tag the fitted image so direct preprocessing can find its cached pixel_values
+        fitted[0].info["sha1"] = digest
+        with self._fit_lock:
+            self._fit_cache[digest] = fitted
+            if len(self._fit_cache) > FIT_CACHE_SIZE:
+                self._fit_cache.popitem(last=False)
+        return fitted
+
+    def prefetch_images(self, requests: List[Tuple[Union[str, bytes], str]]) -> None:
+        """Decode and fit the screenshots of upcoming requests into the fit cache.
+
+        CPU-only, so it can run on another thread while a previous batch is generating.
+        """
+        for image, _ in requests:
+            if not image:
+                continue
+            try:
+                image_data = _image_payload(image)
+                self._fitted_image(image_data, hashlib.sha1(image_data).hexdigest())
+            except Exception:
+                # The request itself reports the failure when it runs
+                logger.debug("prefetch_images failed", exc_info=True)
+
+    def _generate_bboxes(self, requests: List[Tuple[Image.Image, Geometry, str]]) -> List[Tuple[Optional[str], Geometry]]:
+        """Run the model on (fitted image, geometry, instruction) triples from ``_fitted_image``.
+
+        Returns (raw bbox string or None, geometry) per request.
+        """
+        batch_messages = []
+        geometries = []
+        for image, geometry, instruction in requests:
+            geometries.append(geometry)
+
+            # process_vision_info accepts PIL images directly; only write the screenshot
+            # to disk when KEEP_DEBUG_IMG is set
+            if os.getenv("KEEP_DEBUG_IMG"):
+                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
+                    image.save(temp_file.name)
+                logger.debug("   🧩 KEEP_DEBUG_IMG set, saved image to: %s", temp_file.name)
+
+            # Prepare messages for model
+            batch_messages.append([
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "image", "image": image},
+                        {"type": "text", "text": instruction}
+                    ]
+                }
+            ])
+            logger.debug("   🤖 [GROUNDING MODEL: %s] Processing instruction: '%s'", self.model_name, instruction)
+
+        # Generate bounding boxes
+        bbox_strs = self.generate_batch(batch_messages)
+        for bbox_str in bbox_strs:
+            logger.debug("   📦 [GROUNDING MODEL] Raw model output: '%s'", bbox_str)
+        return list(zip(bbox_strs, geometries))
+
+    def _parse_center(self, bbox_str: str, geometry: Geometry) -> Optional[Tuple[int, int]]:
+        """Parse a raw "[x1,y1,x2,y2]" model output into the bbox center.
 
-    def predict_click(self, image_b64: str, instruction: str) -> Optional[Tuple[int, int]]:
+        ``geometry`` maps model-space pixels back to the original screenshot.
+        """
+        # "[x1,y1,x2,y2]" with integer pixel coordinates (fractional parts are truncated)
+        found, x1, y1, x2, y2 = parse_bbox_text(bbox_str)
+        if found:
+            # The model returns ABSOLUTE pixel coordinates, not normalized ones.
+            logger.debug("   📐 Parsed bounding box: [%d, %d, %d, %d]", x1, y1, x2, y2)
+
+            # Center point of the bounding box, scaled and clipped to the original screenshot
+            center_x, center_y = postprocess_bbox(x1, y1, x2, y2, *geometry)
+            if center_x >= 0:
+                logger.debug("   🎯 [GROUNDING MODEL] Calculated center coordinates: (%d, %d)", center_x, center_y)
+                return (int(center_x), int(center_y))
+            logger.error("   ❌ Center outside the image: [%d, %d, %d, %d]", x1, y1, x2, y2)
+        else:
+            logger.error("   ❌ Invalid bounding box format: %s", bbox_str)
+
+        logger.debug("   🚫 Returning None")
+        return None
+
+    def predict_click(
+        self,
+        image_b64: Optional[str],
+        instruction: str,
+        image_bytes: Optional[bytes] = None
+    ) -> Optional[Tuple[int, int]]:
         """Predict click coordinates for grounding.
 
         Args:
             image_b64: Base64 encoded image
             instruction: Description of element to click
+            image_bytes: Raw PNG/JPEG bytes, used instead of image_b64 when given
 
         Returns:
             Tuple of (x, y) coordinates or None if prediction fails
         """
-        print(f"🔬 UI-Venus predict_click called with instruction: '{instruction}'")
-        try:
-            # Ensure we have a clean base64 string
-            if isinstance(image_b64, bytes):
-                image_b64 = image_b64.decode("utf-8", errors="ignore")
-            if image_b64.startswith("data:image"):
-                image_b64 = image_b64.split(",")[-1]
-
-            # Decode base64 → bytes
-            image_data = base64.b64decode(image_b64)
-            image = Image.open(BytesIO(image_data))
-            print(f"   📏 Image size: {image.size}")
+        image = image_bytes if image_bytes is not None else image_b64
+        return self.predict_click_batch([(image, instruction)])[0]
+
+    def predict_click_bytes(self, image_bytes: bytes, instruction: str) -> Optional[Tuple[int, int]]:
+        """Predict click coordinates straight from raw PNG/JPEG screenshot bytes.
+
+        Skips the base64 encode/decode round trip; the bytes are decoded once.
+
+        Returns:
+            Tuple of (x, y) coordinates or None if prediction fails
+        """
+        return self.predict_click_batch([(image_bytes, instruction)])[0]
+
+    def predict_click_batched(self, image_bytes: bytes, instructions: List[str]) -> List[Optional[Tuple[int, int]]]:
+        """Predict click coordinates for several instructions on one screenshot.
+
+        The screenshot is decoded, fitted and preprocessed once; the instructions are
+        left-padded into batched generate calls of up to BATCH_MAX_SIZE prompts.
+
+        Returns:
+            One (x, y) tuple or None per instruction, in order
+        """
+        results: List[Optional[Tuple[int, int]]] = []
+        for start in range(0, len(instructions), BATCH_MAX_SIZE):
+            chunk = instructions[start:start + BATCH_MAX_SIZE]
+            results += self.predict_click_batch([(image_bytes, instruction) for instruction in chunk])
+        return results
 
-            # Save to temporary file (required for Qwen model)
-            import tempfile
-            import os
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-                image.save(temp_file.name)
-                temp_path = temp_file.name
-            print(f"   💾 Saved image to: {temp_path}")
+    def predict_click_batch(self, requests: List[Tuple[Union[str, bytes], str]]) -> List[Optional[Tuple[int, int]]]:
+        """Predict click coordinates for several (image, instruction) pairs.
 
+        Each image is either base64 text or raw PNG/JPEG bytes.
+
+        Cache misses are grounded together in a single generate_batch call.
+
+        Returns:
+            One (x, y) tuple or None per request, in request order
+        """
+        bbox_strs: List[Optional[Tuple[str, Geometry]]] = [None] * len(requests)
+        pending: List[Tuple[int, Tuple[str, str], Image.Image, Geometry, str]] = []
+
+        for idx, (image_b64, instruction) in enumerate(requests):
+            logger.debug("🔬 UI-Venus predict_click called with instruction: '%s'", instruction)
+            if not instruction or not image_b64:
+                # Nothing to ground; never let this reach the model or become a (0, 0) click
+                continue
             try:
-                # Prepare messages for model
-                messages = [
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "image", "image": temp_path},
-                            {"type": "text", "text": instruction}
-                        ]
-                    }
-                ]
-
-                print(f"   🤖 [GROUNDING MODEL: {self.model_name}] Processing instruction: '{instruction}'")
-                # Generate bounding box
-                bbox_str = self.generate(messages)
-                print(f"   📦 [GROUNDING MODEL] Raw model output: '{bbox_str}'")
-
-                # Parse bounding box coordinates
-                try:
-                    box = eval(bbox_str)
-                    print(f"   📐 Parsed bounding box: {box}")
-                    if isinstance(box, list) and len(box) == 4:
-                        # The model returns ABSOLUTE pixel coordinates, not normalized ones.
-                        abs_x1 = float(box[0])
-                        abs_y1 = float(box[1])
-                        abs_x2 = float(box[2])
-                        abs_y2 = float(box[3])
-
-                        # Return center point of bounding box
-                        center_x = int((abs_x1 + abs_x2) / 2)
-                        center_y = int((abs_y1 + abs_y2) / 2)
-
-                        print(f"   🎯 [GROUNDING MODEL] Calculated center coordinates: ({center_x}, {center_y})")
-                        return (center_x, center_y)
-                    else:
-                        print(f"   ❌ Invalid bounding box format: {box}")
-                except (ValueError, SyntaxError, IndexError) as parse_error:
-                    print(f"   ❌ Failed to parse bounding box: {parse_error}")
-
-            finally:
-                # Clean up temporary file unless KEEP_DEBUG_IMG is set
-                if not os.getenv("KEEP_DEBUG_IMG"):
-                    os.unlink(temp_path)
+                # Raw bytes pass straight through; base64 → bytes otherwise
+                image_data = _image_payload(image_b64)
+
+                # Greedy decoding is deterministic, so identical (instruction, screenshot) pairs
+                # can reuse the previous raw output without touching the model.
+                cache_key = (instruction, hashlib.sha1(image_data).hexdigest())
+                with self._bbox_lock:
+                    cached = self._bbox_cache.get(cache_key)
+                    if cached is not None:
+                        self._bbox_cache.move_to_end(cache_key)
+                if cached is not None:
+                    logger.debug("   ♻️  [GROUNDING MODEL] Cached output: '%s'", cached[0])
+                    bbox_strs[idx] = cached
                 else:
-                    print(f"   🧩 KEEP_DEBUG_IMG set, keeping temp file: {temp_path}")
+                    # Decoded here, per request, so a corrupt screenshot only fails its own
+                    # request and not the unrelated ones batched with it. Each screenshot is
+                    # decoded and resized once and reused for every instruction against it.
+                    image, geometry = self._fitted_image(image_data, cache_key[1])
+                    pending.append((idx, cache_key, image, geometry, instruction))
+            except Exception:
+                logger.exception("predict_click failed")
 
-        except Exception as e:
-            print(f"   💥 Error in predict_click: {e}")
-            import traceback
-            traceback.print_exc()
+        if pending:
+            try:
+                generated = self._generate_bboxes(
+                    [(image, geometry, instruction) for _, _, image, geometry, instruction in pending]
+                )
+                for (idx, cache_key, _, _, _), result in zip(pending, generated):
+                    if result[0] is None:
+                        continue
+                    bbox_strs[idx] = result
+                    with self._bbox_lock:
+                        self._bbox_cache[cache_key] = result
+                        if len(self._bbox_cache) > BBOX_CACHE_SIZE:
+                            self._bbox_cache.popitem(last=False)
+            except Exception:
+                logger.exception("predict_click failed")
 
-        print(f"   🚫 Returning None")
-        return None
+        results: List[Optional[Tuple[int, int]]] = []
+        for result in bbox_strs:
+            if result is None:
+                logger.debug("   🚫 Returning None")
+                results.append(None)
+            else:
+                results.append(self._parse_center(*result))
+        return results
+
+
+class _BatchQueue:
+    """Coalesces concurrent predict_click calls on one model into batched forward passes.
+
+    Requests that arrive within ``timeout`` seconds of the first queued one (up to
+    ``max_batch_size``) are grounded together through ``predict_click_batch``, which
+    runs on the queue's own worker threads so the event loop keeps serving other agents.
+
+    Batches are dispatched without waiting for their results: while one batch is on the
+    GPU the next is collected and its screenshots decoded, and it starts as soon as the
+    previous batch finishes.
+    """
+
+    def __init__(self, model: UIVenusGroundModel, max_batch_size: int = BATCH_MAX_SIZE, timeout: float = BATCH_TIMEOUT) -> None:
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.timeout = timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # One thread generates while the other prefetches the next batch's screenshots;
+        # kept apart from the default executor other to_thread work competes for
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ui-venus")
+
+    async def submit(self, image_b64: str, instruction: str) -> Optional[Tuple[int, int]]:
+        """Queue a request and wait for its batched result."""
+        loop = asyncio.get_running_loop()
+        # (Re)start the worker on the current loop, e.g. after a previous asyncio.run() exited
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+        future = loop.create_future()
+        await self._queue.put((image_b64, instruction, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        inflight: Optional[asyncio.Task] = None
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.timeout
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            if len(batch) > 1:
+                logger.debug("📦 [GROUNDING MODEL: %s] Batching %d requests", self.model.model_name, len(batch))
+            requests = [(image_b64, instruction) for image_b64, instruction, _ in batch]
+            # Decode this batch's screenshots while the previous batch is still generating
+            prefetch = loop.run_in_executor(self._executor, self.model.prefetch_images, requests)
+            if inflight is not None:
+                await inflight
+            await prefetch
+            inflight = loop.create_task(self._dispatch(batch, requests))
+
+    async def _dispatch(self, batch, requests) -> None:
+        """Run one batch in the executor and resolve its futures."""
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self._executor, self.model.predict_click_batch, requests)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
 
 
 @register_agent(models=r"(?i).*UI.*Venus.*Ground.*|.*ui.*venus.*ground.*")
@@ -257,8 +975,88 @@ class UIVenusGroundConfig(AsyncAgentConfig):
     based on image and instruction inputs.
     """
 
-    def __init__(self):
-        self.model_instance: Optional[UIVenusGroundModel] = None
+    # Batch queues (each wrapping a loaded model) are shared by every config instance (and
+    # therefore every agent in the process), keyed on
+    # (model_name, device, quantization_bits, quantization_scheme).
+    _BATCH_QUEUES: Dict[Tuple[Any, ...], _BatchQueue] = {}
+    # In-flight background loads, so a preload and concurrent first clicks share one load
+    _LOADING: Dict[Tuple[Any, ...], "asyncio.Future[UIVenusGroundModel]"] = {}
+    # Model loads run here rather than on the default executor, like the batch queues' work
+    _LOAD_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ui-venus-load")
+
+    def __init__(self, preload_model: Optional[str] = None, **model_kwargs):
+        """
+        Args:
+            preload_model: If set, start loading this model on a background loader thread right
+                away (requires a running event loop) so the weights are resident before the
+                first predict_click. Later predict_click calls join this load.
+            **model_kwargs: quantization_bits / quantization_scheme for the preloaded model
+        """
+        if preload_model:
+            self._start_load(preload_model, **model_kwargs)
+
+    @staticmethod
+    def _model_key(model: str, **kwargs) -> Tuple[Any, ...]:
+        model, kwargs = UIVenusGroundConfig._split_model_id(model, **kwargs)
+        return (model, "auto", kwargs.get("quantization_bits"), kwargs.get("quantization_scheme"))
+
+    @staticmethod
+    def _split_model_id(model: str, **kwargs) -> Tuple[str, Dict[str, Any]]:
+        """Strip a "?quant=int8|nf4|awq|gptq" suffix from the model id into loader kwargs.
+
+        e.g. "inclusionAI/UI-Venus-Ground-72B?quant=nf4" loads the 72B checkpoint in 4-bit.
+        An explicit quantization_scheme / quantization_bits kwarg takes precedence.
+        """
+        model, _, query = model.partition("?")
+        for param in filter(None, query.split("&")):
+            name, _, value = param.partition("=")
+            if name != "quant":
+                continue
+            scheme = _QUANT_SUFFIXES.get(value.lower())
+            if scheme is None:
+                raise ValueError(f"Unsupported quant suffix: {value!r} (expected one of {sorted(_QUANT_SUFFIXES)})")
+            if kwargs.get("quantization_scheme") is None and kwargs.get("quantization_bits") is None:
+                kwargs["quantization_scheme"] = scheme
+        return model, kwargs
+
+    @classmethod
+    def _start_load(cls, model: str, **kwargs) -> "asyncio.Future[UIVenusGroundModel]":
+        """Start (or join) a background load of ``model`` without blocking the event loop."""
+        key = cls._model_key(model, **kwargs)
+        model, kwargs = cls._split_model_id(model, **kwargs)
+        future = cls._LOADING.get(key)
+        if future is None:
+            logger.debug("🔧 Initializing UI-Venus-Ground model: %s", model)
+            future = asyncio.get_running_loop().run_in_executor(
+                cls._LOAD_EXECUTOR,
+                lambda: UIVenusGroundModel(
+                    model_name=model,
+                    device="auto",
+                    trust_remote_code=False,
+                    quantization_bits=kwargs.get("quantization_bits"),
+                    quantization_scheme=kwargs.get("quantization_scheme"),
+                ),
+            )
+            cls._LOADING[key] = future
+        return future
+
+    async def _get_queue(self, model: str, **kwargs) -> _BatchQueue:
+        """Return the shared batch queue for ``model``, loading the model on first use."""
+        key = self._model_key(model, **kwargs)
+        queue = UIVenusGroundConfig._BATCH_QUEUES.get(key)
+        if queue is not None:
+            return queue
+        # Concurrent callers for the same key await one shared load; other models load in parallel
+        future = self._start_load(model, **kwargs)
+        try:
+            instance = await future
+        finally:
+            if UIVenusGroundConfig._LOADING.get(key) is future:
+                del UIVenusGroundConfig._LOADING[key]
+        queue = UIVenusGroundConfig._BATCH_QUEUES.get(key)
+        if queue is None:
+            queue = UIVenusGroundConfig._BATCH_QUEUES[key] = _BatchQueue(instance)
+        return queue
 
     async def predict_step(
         self,
@@ -302,44 +1100,26 @@ class UIVenusGroundConfig(AsyncAgentConfig):
         Returns:
             Tuple of (x, y) coordinates or None if prediction fails
         """
-        try:
-            # Initialize model if not already done
-            if self.model_instance is None:
-                print(f"🔧 Initializing UI-Venus-Ground model: {model}")
-                self.model_instance = UIVenusGroundModel(
-                    model_name=model,
-                    device="auto",
-                    trust_remote_code=False
-                )
-
-            # Use the model's predict_click method
-            print(f"🎯 [GROUNDING MODEL: {model}] Predicting click for: '{instruction}'")
-            print("   🖼️  Image provided to grounding model")
+        if not instruction or not image_b64:
+            logger.debug("❌ [GROUNDING MODEL: %s] Missing instruction or image, no prediction", model)
+            return None
 
-            # Initialize model if not already done
-            if self.model_instance is None:
-                print(f"   🔧 Initializing UI-Venus-Ground model: {model}")
-                self.model_instance = UIVenusGroundModel(
-                    model_name=model,
-                    device="auto",
-                    trust_remote_code=False
-                )
-                print("   ✅ Model initialized successfully")
+        try:
+            queue = await self._get_queue(model, **kwargs)
 
-            print(f"   🤖 Calling predict_click with instruction: '{instruction}'")
-            coordinates = self.model_instance.predict_click(image_b64, instruction)
+            logger.debug("🎯 [GROUNDING MODEL: %s] Predicting click for: '%s'", model, instruction)
+            # Concurrent calls on the same model are coalesced into one forward pass
+            coordinates = await queue.submit(image_b64, instruction)
 
             if coordinates:
-                print(f"✅ [GROUNDING MODEL: {model}] Prediction successful: ({coordinates[0]}, {coordinates[1]})")
+                logger.debug("✅ [GROUNDING MODEL: %s] Prediction successful: (%d, %d)", model, coordinates[0], coordinates[1])
                 return coordinates
             else:
-                print(f"❌ [GROUNDING MODEL: {model}] Prediction failed")
+                logger.debug("❌ [GROUNDING MODEL: %s] Prediction failed", model)
                 return None
 
-        except Exception as e:
-            print(f"💥 Error in UI-Venus-Ground prediction: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("💥 Error in UI-Venus-Ground prediction")
             return None
 
     def get_capabilities(self) -> List[AgentCapability]:
@@ -120,7 +120,8 @@ async def main():
         try:
             # Get user input
             print(f"\n{'='*40}")
-            user_input = input("🎯 Enter instruction (or command): ").strip()
+            # Read stdin on a worker thread so the event loop keeps running meanwhile
+            user_input = (await asyncio.to_thread(input, "🎯 Enter instruction (or command): ")).strip()
             
             if not user_input:
                 continue
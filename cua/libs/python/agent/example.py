@@ -120,7 +120,7 @@ async def main():
         
         history = []
         while True:
-            user_input = input("> ")
+            user_input = await asyncio.to_thread(input, "> ")
             history.append({"role": "user", "content": user_input})
 
             # Non-streaming usage
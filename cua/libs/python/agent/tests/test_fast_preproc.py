@@ -0,0 +1,71 @@
+"""
+Equivalence tests for the fused numba preprocessing kernel used by the UI-Venus loop.
+
+normalize_patchify must produce the same pixel_values as the Qwen2.5-VL image
+processor for a frame that is already at its target size.
+"""
+
+import pytest
+
+pytest.importorskip("numba")
+np = pytest.importorskip("numpy")
+
+from agent.loops._fast_preproc import normalize_patchify
+
+# Qwen2.5-VL image processor defaults (OpenAI CLIP statistics)
+MEAN = np.array([0.48145466, 0.4578275, 0.40821073], dtype=np.float32)
+STD = np.array([0.26862954, 0.26130258, 0.27577711], dtype=np.float32)
+TEMPORAL, PATCH, MERGE = 2, 14, 2
+
+# Heights/widths are multiples of PATCH * MERGE, as smart_resize guarantees
+SHAPES = [(28, 28), (56, 84), (112, 56), (84, 140)]
+
+
+def random_frame(height, width, seed=0):
+    return np.random.RandomState(seed).randint(0, 256, (height, width, 3), dtype=np.uint8)
+
+
+def run_kernel(frame):
+    height, width, channel = frame.shape
+    rows = (height // PATCH) * (width // PATCH)
+    out = np.empty((rows, channel * TEMPORAL * PATCH * PATCH), dtype=np.float32)
+    normalize_patchify(frame, MEAN, STD, TEMPORAL, PATCH, MERGE, out)
+    return out
+
+
+def reference_patchify(frame):
+    """The image processor's normalize + expand/reshape/transpose steps in plain numpy."""
+    height, width, channel = frame.shape
+    grid_h, grid_w = height // PATCH, width // PATCH
+    pixels = ((frame / 255.0 - MEAN) / STD).transpose(2, 0, 1)
+    patches = np.broadcast_to(pixels[None], (TEMPORAL, channel, height, width))
+    patches = patches.reshape(
+        1, TEMPORAL, channel, grid_h // MERGE, MERGE, PATCH, grid_w // MERGE, MERGE, PATCH
+    )
+    patches = patches.transpose(0, 3, 6, 4, 7, 2, 1, 5, 8)
+    return patches.reshape(grid_h * grid_w, channel * TEMPORAL * PATCH * PATCH)
+
+
+@pytest.mark.parametrize("height, width", SHAPES)
+def test_normalize_patchify_matches_reference(height, width):
+    frame = random_frame(height, width)
+    np.testing.assert_allclose(run_kernel(frame), reference_patchify(frame), rtol=0, atol=1e-5)
+
+
+@pytest.mark.parametrize("height, width", SHAPES)
+def test_normalize_patchify_matches_image_processor(height, width):
+    transformers = pytest.importorskip("transformers")
+    Image = pytest.importorskip("PIL.Image")
+
+    processor = transformers.Qwen2VLImageProcessor(
+        image_mean=MEAN.tolist(),
+        image_std=STD.tolist(),
+        temporal_patch_size=TEMPORAL,
+        patch_size=PATCH,
+        merge_size=MERGE,
+    )
+    frame = random_frame(height, width)
+    expected = processor(images=Image.fromarray(frame), do_resize=False, return_tensors="np")
+
+    assert expected["image_grid_thw"].tolist() == [[1, height // PATCH, width // PATCH]]
+    np.testing.assert_allclose(run_kernel(frame), expected["pixel_values"], rtol=0, atol=1e-5)
@@ -0,0 +1,79 @@
+"""
+Equivalence tests for the numba bbox scanner used by the UI-Venus grounding loop.
+
+parse_bbox replaced a regex search over the decoded model output; these tests check
+that both find the same first bbox on typical outputs, edge cases and random strings.
+"""
+
+import random
+import re
+
+import pytest
+
+pytest.importorskip("numba")
+
+from agent.loops._grounding_postprocess import parse_bbox_text, postprocess_bbox
+
+# The regex parse_bbox replaced. ASCII mode: the scanner works on bytes, and the model
+# only emits ASCII digits and whitespace inside the brackets.
+_BBOX_RE = re.compile(
+    r"\[\s*(-?\d+)(?:\.\d*)?\s*,\s*(-?\d+)(?:\.\d*)?\s*,"
+    r"\s*(-?\d+)(?:\.\d*)?\s*,\s*(-?\d+)(?:\.\d*)?\s*\]",
+    re.ASCII,
+)
+
+
+def regex_parse(text):
+    match = _BBOX_RE.search(text)
+    if match is None:
+        return False, 0, 0, 0, 0
+    return (True, *map(int, match.groups()))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[100, 200, 300, 400]",
+        "[12.5,3.0, 40 ,50.75]",
+        "[ 1 , 2 , 3 , 4 ]",
+        "[1,\n2,\t3,\r\n4 ]",
+        "[1., 2, 3, 4.]",
+        "[-5, 0, -10, 20]",
+        "[[1, 2, 3, 4]]",
+        "[1, 2, 3, 4, 5] [6, 7, 8, 9]",
+        "[a, 1, 2, 3] then [1, 2, 3, 4]",
+        "[1, 2, 3] [4, 5, 6, 7]",
+        "[1, 2, 3, 4",
+        "[.5, 1, 2, 3]",
+        "[1, - 2, 3, 4]",
+        "[1,,2, 3, 4]",
+        "点击 [10, 20, 30, 40] 按钮",
+        "The element is at [512, 384, 640, 420].",
+        "no bbox here",
+        "",
+    ],
+)
+def test_parse_bbox_matches_regex(text):
+    assert parse_bbox_text(text) == regex_parse(text)
+
+
+def test_parse_bbox_matches_regex_on_random_text():
+    rng = random.Random(0)
+    alphabet = "[]0123456789-.,  \t\nab"
+    for _ in range(5000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert parse_bbox_text(text) == regex_parse(text), text
+
+
+@pytest.mark.parametrize(
+    "bbox, src, dst, expected",
+    [
+        ((10, 20, 30, 40), (100, 100), (100, 100), (20, 30)),
+        ((10, 20, 30, 40), (100, 100), (200, 50), (40, 15)),
+        ((90, 90, 130, 130), (100, 100), (100, 100), (-1, -1)),
+        ((-30, 10, 10, 20), (100, 100), (100, 100), (-1, -1)),
+        ((98, 98, 99, 99), (100, 100), (100, 100), (98, 98)),
+    ],
+)
+def test_postprocess_bbox(bbox, src, dst, expected):
+    assert tuple(postprocess_bbox(*bbox, *src, *dst)) == expected
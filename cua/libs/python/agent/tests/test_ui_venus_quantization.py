@@ -0,0 +1,148 @@
+"""
+Tests for how the UI-Venus loop picks the precision a grounding model is loaded in:
+the "?quant=" model id suffix, the VRAM estimate, and the automatic fp16 -> INT8 -> NF4
+fallback. GPU state and bitsandbytes availability are faked, so no GPU is needed.
+"""
+
+import importlib.util
+from types import SimpleNamespace
+
+import pytest
+
+from agent.loops import ui_venus_ground
+from agent.loops.ui_venus_ground import UIVenusGroundConfig, _estimate_vram, _pick_quantization
+
+GB = 1e9
+MODEL_7B = "inclusionAI/UI-Venus-Ground-7B"
+
+
+@pytest.fixture
+def fake_gpu(monkeypatch):
+    """Fake ``torch.cuda`` and the bitsandbytes lookup: fake_gpu(free_gb_per_device, ...)."""
+
+    def install(free_gb, device_count=1, bitsandbytes=True, cuda=True):
+        cuda_module = SimpleNamespace(
+            is_available=lambda: cuda,
+            device_count=lambda: device_count,
+            mem_get_info=lambda device: (int(free_gb * GB), int(80 * GB)),
+        )
+        monkeypatch.setattr(ui_venus_ground, "torch", SimpleNamespace(cuda=cuda_module), raising=False)
+
+        find_spec = importlib.util.find_spec
+
+        def fake_find_spec(name, *args, **kwargs):
+            if name == "bitsandbytes":
+                return object() if bitsandbytes else None
+            return find_spec(name, *args, **kwargs)
+
+        monkeypatch.setattr(ui_venus_ground.importlib.util, "find_spec", fake_find_spec)
+
+    return install
+
+
+@pytest.mark.parametrize(
+    "suffix, scheme",
+    [("int8", "bnb8"), ("bnb8", "bnb8"), ("nf4", "bnb4"), ("int4", "bnb4"), ("NF4", "bnb4"), ("awq", "awq"), ("gptq", "gptq")],
+)
+def test_split_model_id_maps_quant_suffix(suffix, scheme):
+    model, kwargs = UIVenusGroundConfig._split_model_id(f"{MODEL_7B}?quant={suffix}")
+    assert model == MODEL_7B
+    assert kwargs == {"quantization_scheme": scheme}
+
+
+def test_split_model_id_without_suffix():
+    assert UIVenusGroundConfig._split_model_id(MODEL_7B) == (MODEL_7B, {})
+
+
+def test_split_model_id_ignores_other_params():
+    assert UIVenusGroundConfig._split_model_id(f"{MODEL_7B}?rev=main&quant=int8") == (
+        MODEL_7B,
+        {"quantization_scheme": "bnb8"},
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"quantization_scheme": "bnb8"}, {"quantization_bits": 8}],
+)
+def test_split_model_id_explicit_kwargs_win(kwargs):
+    model, result = UIVenusGroundConfig._split_model_id(f"{MODEL_7B}?quant=nf4", **kwargs)
+    assert model == MODEL_7B
+    assert result == kwargs
+
+
+def test_split_model_id_rejects_unknown_suffix():
+    with pytest.raises(ValueError, match="Unsupported quant suffix"):
+        UIVenusGroundConfig._split_model_id(f"{MODEL_7B}?quant=fp8")
+
+
+def test_model_key_matches_suffix_and_kwarg():
+    assert UIVenusGroundConfig._model_key(f"{MODEL_7B}?quant=nf4") == UIVenusGroundConfig._model_key(
+        MODEL_7B, quantization_scheme="bnb4"
+    )
+
+
+@pytest.mark.parametrize(
+    "model_name, scheme, params",
+    [
+        (MODEL_7B, None, 7e9 * 2.0),
+        (MODEL_7B, "bnb8", 7e9 * 1.0),
+        ("inclusionAI/UI-Venus-Ground-72B", "bnb4", 72e9 * 0.5),
+        ("Qwen/Qwen2.5-VL-7B-Instruct", None, 7e9 * 2.0),
+        ("org/tiny-grounder-1.5b", "awq", 1.5e9 * 0.5),
+    ],
+)
+def test_estimate_vram(model_name, scheme, params):
+    assert _estimate_vram(model_name, scheme) == int(params * ui_venus_ground.VRAM_OVERHEAD)
+
+
+@pytest.mark.parametrize("model_name", ["inclusionAI/UI-Venus-Ground", "7B-org/grounder"])
+def test_estimate_vram_without_size(model_name):
+    assert _estimate_vram(model_name, None) is None
+
+
+# The 7B needs ~16.8 GB in 16-bit, ~8.4 GB in INT8 and ~4.2 GB in NF4; 90% of free VRAM is usable
+@pytest.mark.parametrize(
+    "free_gb, device_count, expected",
+    [
+        (40, 1, None),
+        (12, 1, "bnb8"),
+        (6, 1, "bnb4"),
+        (7, 2, "bnb8"),
+    ],
+)
+def test_pick_quantization_fits_free_vram(fake_gpu, free_gb, device_count, expected):
+    fake_gpu(free_gb, device_count=device_count)
+    assert _pick_quantization(MODEL_7B, None) == expected
+
+
+def test_pick_quantization_fails_fast_when_nothing_fits(fake_gpu):
+    fake_gpu(3)
+    with pytest.raises(MemoryError, match="even in 4-bit"):
+        _pick_quantization(MODEL_7B, None)
+
+
+def test_pick_quantization_without_bitsandbytes(fake_gpu):
+    fake_gpu(12, bitsandbytes=False)
+    with pytest.raises(MemoryError, match="install bitsandbytes"):
+        _pick_quantization(MODEL_7B, None)
+
+
+def test_pick_quantization_without_bitsandbytes_when_fp16_fits(fake_gpu):
+    fake_gpu(40, bitsandbytes=False)
+    assert _pick_quantization(MODEL_7B, None) is None
+
+
+def test_pick_quantization_keeps_explicit_scheme(fake_gpu):
+    fake_gpu(1)
+    assert _pick_quantization(MODEL_7B, "bnb8") == "bnb8"
+
+
+def test_pick_quantization_without_cuda(fake_gpu):
+    fake_gpu(1, cuda=False)
+    assert _pick_quantization(MODEL_7B, None) is None
+
+
+def test_pick_quantization_unknown_size(fake_gpu):
+    fake_gpu(1)
+    assert _pick_quantization("inclusionAI/UI-Venus-Ground", None) is None
@@ -3,12 +3,23 @@ from typing import Tuple, Optional, Dict, Any
 from PIL import Image, ImageDraw
 import io
 
+# Optional SIMD base64 codec (libbase64): every screenshot crosses the websocket as a
+# multi-megabyte base64 string, decoded here without the stdlib's intermediate copies
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
 def decode_base64_image(base64_str: str) -> bytes:
     """Decode a base64 string into image bytes."""
+    if pybase64 is not None:
+        return pybase64.b64decode(base64_str)
     return base64.b64decode(base64_str)
 
 def encode_base64_image(image_bytes: bytes) -> str:
     """Encode image bytes to base64 string."""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(image_bytes)
     return base64.b64encode(image_bytes).decode('utf-8')
 
 def bytes_to_image(image_bytes: bytes) -> Image.Image:
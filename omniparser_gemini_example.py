@@ -13,26 +13,30 @@ The omniparser allows you to use Gemini models for computer automation tasks:
 """
 
 import asyncio
+import importlib.util
+import json
 import os
 import sys
 import logging
 import subprocess
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
 from pathlib import Path
 
-# Add local CUA directory to Python path (for development)
-cua_path = os.path.join(os.path.dirname(__file__), "cua", "libs", "python")
-if cua_path not in sys.path:
-    sys.path.insert(0, cua_path)
+try:
+    import aiodocker
+    AIODOCKER_AVAILABLE = True
+except ImportError:
+    AIODOCKER_AVAILABLE = False
 
-# Also add individual package paths (needed for inter-package imports)
-agent_path = os.path.join(cua_path, "agent")
-computer_path = os.path.join(cua_path, "computer")
-core_path = os.path.join(cua_path, "core")
-
-for path in [agent_path, computer_path, core_path]:
-    if path not in sys.path:
-        sys.path.insert(0, path)
+# Use the local CUA packages. With an editable install
+#   pip install -e cua/libs/python/core -e cua/libs/python/computer -e cua/libs/python/agent
+# they are already importable and sys.path is left alone; otherwise (e.g. only the
+# PyPI cua-agent is installed) the local package directories are put in front once.
+cua_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cua", "libs", "python")
+_agent_spec = importlib.util.find_spec("agent")
+if _agent_spec is None or not (_agent_spec.origin or "").startswith(cua_path):
+    sys.path[:0] = [os.path.join(cua_path, name) for name in ("agent", "computer", "core")]
 
 # Import CUA components
 from agent import ComputerAgent
@@ -42,13 +46,20 @@ from agent.callbacks import AsyncCallbackHandler
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+# Set OMNIPARSER_DEBUG=1 to log the model inputs/outputs from OmniparserDebugCallback
+if os.getenv("OMNIPARSER_DEBUG"):
+    logger.setLevel(logging.DEBUG)
 
 class OmniparserDebugCallback(AsyncCallbackHandler):
     """Callback to capture and display omniparser model interactions"""
 
     async def on_llm_start(self, messages):
         """Called before LLM processing"""
-        print("\n🤖 === OMNIPARSER MODEL INPUT ===")
+        if not logger.isEnabledFor(logging.DEBUG):
+            return messages
+        # One log record per dump; %-args are only formatted by the handler (%.200s
+        # truncates during formatting instead of slicing the full text first)
+        fmt, args = ["\n🤖 === OMNIPARSER MODEL INPUT ==="], []
         for i, msg in enumerate(messages):
             role = msg.get('role', 'unknown')
             content = msg.get('content', '')
@@ -56,79 +67,200 @@ class OmniparserDebugCallback(AsyncCallbackHandler):
                 # Handle structured content (like with images)
                 for j, part in enumerate(content):
                     if part.get('type') == 'text':
-                        print(f"  {i}.{j} [{role}]: {part.get('text', '')[:200]}...")
+                        fmt.append("  %d.%d [%s]: %.200s...")
+                        args += [i, j, role, part.get('text', '')]
                     elif part.get('type') == 'image_url':
-                        print(f"  {i}.{j} [{role}]: [SCREENSHOT IMAGE]")
+                        fmt.append("  %d.%d [%s]: [SCREENSHOT IMAGE]")
+                        args += [i, j, role]
             else:
-                print(f"  {i} [{role}]: {str(content)[:200]}...")
-        print("🤖 === END OMNIPARSER MODEL INPUT ===\n")
+                fmt.append("  %d [%s]: %.200s...")
+                args += [i, role, content]
+        fmt.append("🤖 === END OMNIPARSER MODEL INPUT ===\n")
+        logger.debug("\n".join(fmt), *args)
         return messages
 
     async def on_llm_end(self, messages):
         """Called after LLM processing"""
-        print("\n🧠 === OMNIPARSER MODEL OUTPUT ===")
+        if not logger.isEnabledFor(logging.DEBUG):
+            return messages
+        fmt, args = ["\n🧠 === OMNIPARSER MODEL OUTPUT ==="], []
         for i, msg in enumerate(messages):
             msg_type = msg.get('type', 'unknown')
             if msg_type == 'message':
-                content = msg.get('content', '')
-                print(f"  {i} [{msg_type}]: {content}")
+                fmt.append("  %d [%s]: %s")
+                args += [i, msg_type, msg.get('content', '')]
             elif msg_type == 'function_call':
-                print(f"  {i} [{msg_type}]: Tool call detected")
-                print(f"    Function: {msg.get('name')}")
-                print(f"    Arguments: {msg.get('arguments')}")
+                fmt += ["  %d [%s]: Tool call detected", "    Function: %s", "    Arguments: %s"]
+                args += [i, msg_type, msg.get('name'), msg.get('arguments')]
             elif msg_type == 'computer_call':
-                print(f"  {i} [{msg_type}]: Computer call detected")
-                action = msg.get('action', {})
-                print(f"    Action: {action}")
+                fmt += ["  %d [%s]: Computer call detected", "    Action: %s"]
+                args += [i, msg_type, msg.get('action', {})]
             else:
-                print(f"  {i} [{msg_type}]: {str(msg)[:200]}...")
-        print("🧠 === END OMNIPARSER MODEL OUTPUT ===\n")
+                fmt.append("  %d [%s]: %.200s...")
+                args += [i, msg_type, msg]
+        fmt.append("🧠 === END OMNIPARSER MODEL OUTPUT ===\n")
+        logger.debug("\n".join(fmt), *args)
         return messages
 
-def cleanup_docker_containers():
-    """Clean up any existing omniparser containers and any containers using port 8000"""
+# Shared Docker API client, created on first use and closed at the end of main()
+_docker_client: Optional["aiodocker.Docker"] = None
+
+# How the example container is reused between examples and runs:
+#   "none"       - create a fresh container every time and stop it afterwards (~30-60s)
+#   "keep_alive" - leave the container running and only close open windows (~2-5s)
+#   "pause"      - pause the container when done and unpause it next time (~5-15s)
+# keep_alive and pause leave the container behind (holding ports 8000/6901) after the
+# script exits, so they are opt-in.
+CONTAINER_REUSE_STRATEGY = os.getenv("OMNIPARSER_CONTAINER_REUSE", "none")
+
+# Every container publishes the same host ports, so all examples share one reusable container
+REUSABLE_CONTAINER_NAME = "omniparser-shared"
+
+# Connected computer kept around by the keep_alive strategy
+_reusable_computer: Optional[Computer] = None
+
+def get_docker_client() -> "aiodocker.Docker":
+    """Return the shared aiodocker client, creating it lazily"""
+    global _docker_client
+    if not AIODOCKER_AVAILABLE:
+        raise RuntimeError("aiodocker is required for this container reuse strategy: pip install aiodocker")
+    if _docker_client is None:
+        _docker_client = aiodocker.Docker()
+    return _docker_client
+
+async def close_docker_client():
+    """Close the shared aiodocker client if one was created"""
+    global _docker_client
+    if _docker_client is not None:
+        await _docker_client.close()
+        _docker_client = None
+
+def _container_name(container) -> str:
+    names = container["Names"] or [container.id]
+    return names[0].lstrip("/")
+
+async def cleanup_docker_containers(keep=()):
+    """Clean up any existing omniparser containers and any containers using port 8000
+
+    Containers whose names are in ``keep`` (the reusable example containers) are left alone.
+    """
+    if not AIODOCKER_AVAILABLE:
+        await asyncio.to_thread(cleanup_docker_containers_cli, keep)
+        return
+
     try:
+        docker = get_docker_client()
+
         # Stop and remove any existing omniparser containers
-        result = subprocess.run(
-            ["docker", "ps", "-a", "--filter", "name=omniparser-", "--format", "{{.Names}}"],
-            capture_output=True, text=True, timeout=10
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            containers = result.stdout.strip().split('\n')
+        containers = await docker.containers.list(all=True, filters=json.dumps({"name": ["omniparser-"]}))
+        containers = [c for c in containers if _container_name(c) not in keep]
+        if containers:
             for container in containers:
-                if container and container.strip():
-                    print(f"🧹 Cleaning up existing container: {container}")
-                    subprocess.run(["docker", "stop", container], timeout=10, capture_output=True)
-                    subprocess.run(["docker", "rm", container], timeout=10, capture_output=True)
-        
+                print(f"🧹 Cleaning up existing container: {_container_name(container)}")
+            await asyncio.gather(*[c.stop(t=5) for c in containers], return_exceptions=True)
+            await asyncio.gather(*[c.delete() for c in containers], return_exceptions=True)
+
         # Also check for any containers using port 8000
-        port_result = subprocess.run(
-            ["docker", "ps", "--filter", "publish=8000", "--format", "{{.Names}}"],
+        port_containers = await docker.containers.list(filters=json.dumps({"publish": ["8000"]}))
+        port_containers = [c for c in port_containers if _container_name(c) not in keep]
+        if port_containers:
+            for container in port_containers:
+                print(f"🧹 Stopping container using port 8000: {_container_name(container)}")
+            await asyncio.gather(*[c.stop(t=5) for c in port_containers], return_exceptions=True)
+
+    except Exception as e:
+        print(f"⚠️  Docker API cleanup failed ({e}), falling back to the docker CLI")
+        await asyncio.to_thread(cleanup_docker_containers_cli, keep)
+
+def _stop_and_remove(container: str, remove: bool = True):
+    subprocess.run(["docker", "stop", container], timeout=10, capture_output=True)
+    if remove:
+        subprocess.run(["docker", "rm", container], timeout=10, capture_output=True)
+
+def cleanup_docker_containers_cli(keep=()):
+    """Same cleanup as cleanup_docker_containers through the docker CLI.
+
+    Used when aiodocker is not installed or cannot reach the daemon. A single
+    ``docker ps`` lists everything; both filters are applied in Python and the
+    per-container stop/rm calls run in parallel.
+    """
+    try:
+        result = subprocess.run(
+            ["docker", "ps", "-a", "--format", "{{.Names}}\t{{.Ports}}\t{{.State}}"],
             capture_output=True, text=True, timeout=10
         )
-        if port_result.returncode == 0 and port_result.stdout.strip():
-            port_containers = port_result.stdout.strip().split('\n')
-            for container in port_containers:
-                if container and container.strip():
-                    print(f"🧹 Stopping container using port 8000: {container}")
-                    subprocess.run(["docker", "stop", container], timeout=10, capture_output=True)
-                    
+        if result.returncode != 0:
+            return
+
+        to_remove, to_stop = [], []
+        for line in result.stdout.splitlines():
+            name, ports, state = (line.split("\t") + ["", ""])[:3]
+            if not name or name in keep:
+                continue
+            if name.startswith("omniparser-"):
+                to_remove.append(name)
+            elif state == "running" and ":8000->" in ports:
+                to_stop.append(name)
+
+        for container in to_remove:
+            print(f"🧹 Cleaning up existing container: {container}")
+        for container in to_stop:
+            print(f"🧹 Stopping container using port 8000: {container}")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for container in to_remove:
+                pool.submit(_stop_and_remove, container)
+            for container in to_stop:
+                pool.submit(_stop_and_remove, container, False)
+
     except Exception as e:
         print(f"⚠️  Warning: Could not cleanup containers: {e}")
 
-async def setup_computer(example_name="demo"):
+# Close every application window (wmctrl ships in the cua-ubuntu image); sticky windows
+# such as the desktop and panels sit on desktop -1 and are left alone. Firefox, the app the
+# examples open, is killed in case it ignores the close request.
+RESET_DESKTOP_COMMAND = (
+    "wmctrl -l | awk '$2 != -1 {print $1}' | xargs -r -n1 wmctrl -ic; "
+    "pkill -x firefox; true"
+)
+
+async def reset_workspace(computer: Computer):
+    """Close the windows the previous example left open so a reused container starts clean.
+
+    The examples only take screenshots and open applications; they do not write files.
+    """
+    await computer.interface.run_command(RESET_DESKTOP_COMMAND)
+
+async def setup_computer(example_name="demo", strategy=CONTAINER_REUSE_STRATEGY):
     """Setup and return a computer instance"""
+    global _reusable_computer
+    if strategy == "keep_alive" and _reusable_computer is not None:
+        print(f"♻️  Reusing Docker computer for {example_name}...")
+        await reset_workspace(_reusable_computer)
+        return _reusable_computer
+
     print("📦 Setting up Docker computer...")
-    
-    # Use unique names to avoid conflicts
-    import random
-    import time
-    port_offset = random.randint(1000, 9999)
-    container_name = f"omniparser-{example_name}-{port_offset}"
-    
-    # Wait a bit to ensure any previous containers are fully cleaned up
-    await asyncio.sleep(1)
-    
+
+    if strategy == "none":
+        # Use unique names to avoid conflicts
+        import random
+        port_offset = random.randint(1000, 9999)
+        container_name = f"omniparser-{example_name}-{port_offset}"
+
+        # Wait a bit to ensure any previous containers are fully cleaned up
+        await asyncio.sleep(1)
+    else:
+        container_name = REUSABLE_CONTAINER_NAME
+        if strategy == "pause":
+            docker = get_docker_client()
+            try:
+                container = await docker.containers.get(container_name)
+                if container["State"]["Paused"]:
+                    print(f"▶️  Unpausing container: {container_name}")
+                    await container.unpause()
+            except aiodocker.DockerError:
+                pass  # Not created yet; Computer.run() will create it
+
+    # The Docker provider re-attaches to an existing container with the same name
     computer = Computer(
         os_type="linux",
         provider_type=VMProviderType.DOCKER,
@@ -136,8 +268,24 @@ async def setup_computer(example_name="demo"):
         image="trycua/cua-ubuntu:latest",
     )
     await computer.run()
+
+    if strategy != "none":
+        await reset_workspace(computer)
+    if strategy == "keep_alive":
+        _reusable_computer = computer
     return computer
 
+async def release_computer(computer: Computer, strategy=CONTAINER_REUSE_STRATEGY):
+    """Hand a computer back according to the container reuse strategy"""
+    if strategy == "keep_alive":
+        await reset_workspace(computer)
+    elif strategy == "pause":
+        await computer.disconnect()
+        container = await get_docker_client().containers.get(REUSABLE_CONTAINER_NAME)
+        await container.pause()
+    else:
+        await computer.stop()
+
 async def run_omniparser_gemini_example():
     """Example 1: Simple omniparser + Gemini"""
     print("\n🚀 Example 1: Simple Omniparser + Gemini 1.5 Pro")
@@ -172,7 +320,7 @@ async def run_omniparser_gemini_example():
         print("✅ Example 1 completed!")
         
     finally:
-        await computer.stop()
+        await release_computer(computer)
 
 
 async def run_gemini_flash_example():
@@ -216,7 +364,7 @@ async def run_gemini_flash_example():
         print(f"✅ {model_name} test completed!")
         
     finally:
-        await computer.stop()
+        await release_computer(computer)
 
 async def run_custom_instructions_example():
     """Example 3: Omniparser + Gemini with custom instructions"""
@@ -287,7 +435,7 @@ async def run_custom_instructions_example():
         print("✅ Example 3 completed!")
         
     finally:
-        await computer.stop()
+        await release_computer(computer)
 
 async def main():
     """Main function to run all examples"""
@@ -302,19 +450,17 @@ async def main():
     
     print(f"✅ Google API key found: {os.getenv('GOOGLE_API_KEY')[:10]}...")
     
-    # Clean up any existing containers first
-    cleanup_docker_containers()
+    # Clean up any existing containers first, keeping the one we intend to reuse
+    keep = set() if CONTAINER_REUSE_STRATEGY == "none" else {REUSABLE_CONTAINER_NAME}
+    await cleanup_docker_containers(keep=keep)
     
     try:
-        # Run examples with delays between them
+        # Run examples one after another: every Docker container publishes the same host
+        # ports (8000 API, 6901 VNC) and the computer interface always talks to port 8000
         await run_omniparser_gemini_example()
-        await asyncio.sleep(2)  # Wait between examples
-        
         await run_gemini_flash_example()
-        await asyncio.sleep(2)  # Wait between examples
-        
         await run_custom_instructions_example()
-        
+
         print("\n🎉 All examples completed successfully!")
         print("\n📁 Trajectory files saved to:")
         print("  - omniparser_trajectories/")
@@ -323,13 +469,18 @@ async def main():
         print("\n🌐 View trajectories at: https://trycua.com/trajectory-viewer")
         
     except Exception as e:
-        logger.error(f"❌ Error running examples: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error("❌ Error running examples: %s", e, exc_info=e)
         raise
     finally:
         # Final cleanup
-        cleanup_docker_containers()
+        await cleanup_docker_containers(keep=keep)
+        await close_docker_client()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Prefer uvloop's faster event loop for the agent's websocket and API traffic
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -0,0 +1,46 @@
+"""
+Background model loading for the test scripts.
+
+The multi-GB checkpoint load runs on a daemon thread, so a script that fails or returns
+before the model is ready exits right away instead of waiting for the load to finish.
+"""
+
+import asyncio
+import threading
+
+
+def load_in_background(factory, *args, **kwargs) -> asyncio.Future:
+    """Call ``factory(*args, **kwargs)`` on a daemon thread; the returned future gets its result."""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(result, error):
+        # The caller may have cancelled (discarded) the load in the meantime
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def run():
+        result, error = None, None
+        try:
+            result = factory(*args, **kwargs)
+        except Exception as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(resolve, result, error)
+        except RuntimeError:
+            pass  # The event loop already closed
+
+    threading.Thread(target=run, name="model-load", daemon=True).start()
+    return future
+
+
+def discard_load(future: asyncio.Future) -> None:
+    """Drop a load nobody will await: cancel it, or consume its error so asyncio does not log it."""
+    if not future.done():
+        future.cancel()
+    elif not future.cancelled():
+        future.exception()
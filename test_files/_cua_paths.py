@@ -0,0 +1,26 @@
+"""
+Shared sys.path setup for running the test scripts against the local CUA checkout.
+"""
+
+import importlib.util
+import os
+import sys
+
+# cua/libs/python lives at the repository root, one level above test_files/
+CUA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cua", "libs", "python")
+
+# Package roots, so 'agent' resolves to agent/agent rather than the libs/python/agent directory
+CUA_SYS_PATHS = tuple(os.path.join(CUA_PATH, name) for name in ("agent", "computer", "core"))
+
+
+def add_cua_paths() -> None:
+    """Put the local CUA packages in front of sys.path unless they already resolve there.
+
+    With an editable install of core/computer/agent the local packages are importable
+    as-is and sys.path is left alone.
+    """
+    spec = importlib.util.find_spec("agent")
+    if spec is not None and (spec.origin or "").startswith(CUA_PATH):
+        return
+    present = set(sys.path)
+    sys.path[:0] = [path for path in CUA_SYS_PATHS if path not in present]
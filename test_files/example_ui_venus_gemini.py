@@ -13,28 +13,18 @@ The composed grounded approach works in two stages:
 
 import asyncio
 import os
-import sys
 import logging
 from typing import List, Dict, Any
 
-# Add local CUA directory to Python path (for development)
-cua_path = os.path.join(os.path.dirname(__file__), "cua", "libs", "python")
-if cua_path not in sys.path:
-    sys.path.insert(0, cua_path)
-
-# Also add individual package paths (needed for inter-package imports)
-agent_path = os.path.join(cua_path, "agent")
-computer_path = os.path.join(cua_path, "computer")
-core_path = os.path.join(cua_path, "core")
-
-for path in [agent_path, computer_path, core_path]:
-    if path not in sys.path:
-        sys.path.insert(0, path)
+# Add local CUA packages to Python path (for development)
+from _cua_paths import add_cua_paths
+add_cua_paths()
 
 # Import CUA components
 from agent import ComputerAgent
 from computer import Computer, VMProviderType
 from agent.callbacks import AsyncCallbackHandler
+from agent.loops.ui_venus_ground import UIVenusGroundConfig
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -94,7 +84,14 @@ async def main():
         print("Please set your Google API key: export GOOGLE_API_KEY=your_key_here")
         return
 
+    grounding_model_name = "inclusionAI/UI-Venus-Ground-7B"
+
     try:
+        # Start loading the grounding model in the background; the load is shared by every
+        # UI-Venus config, so the agent's grounding config picks it up once the VM is up
+        print(f"🔧 Preloading grounding model: {grounding_model_name}")
+        UIVenusGroundConfig(preload_model=grounding_model_name, quantization_bits=8)
+
         # Setup Docker computer
         print("📦 Setting up Docker computer...")
         computer = Computer(
@@ -120,7 +117,7 @@ async def main():
         os.environ["LMSTUDIO_BASE_URL"] = LMSTUDIO_BASE_URL
         os.environ["LMSTUDIO_MODEL"] = LMSTUDIO_MODEL
         
-        model = f"inclusionAI/UI-Venus-Ground-7B+gemini/gemini-1.5-pro"
+        model = f"{grounding_model_name}+gemini/gemini-1.5-pro"
 
         debug_callback = ModelDebugCallback()
 
@@ -155,6 +152,11 @@ async def main():
             verbosity=logging.INFO,
             trajectory_dir="cua_trajectories",
             use_prompt_caching=True,
+            # Grounding model quantization (forwarded to UIVenusGroundModel):
+            # - Latency: quantization_scheme="awq" (or "gptq") with a prequantized checkpoint such as
+            #   UI-Venus-Ground-7B-AWQ. INT4 weight-only GEMMs beat bitsandbytes at batch=1.
+            # - Memory, any checkpoint: quantization_bits=8 / quantization_scheme="bnb8" (or "bnb4").
+            #   LLM.int8() routes outliers through FP16 and is slower than plain FP16 at batch=1.
             quantization_bits=8,
         )
 
@@ -255,4 +257,10 @@ async def main():
             pass
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop's libuv-based loop is faster for the many concurrent API/Docker calls here
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
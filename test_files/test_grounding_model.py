@@ -7,28 +7,93 @@ You can input element descriptions and see the predicted coordinates.
 """
 
 import asyncio
+import functools
 import os
-import sys
-import base64
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
-# Add local CUA directory to Python path (for development)
-cua_path = os.path.join(os.path.dirname(__file__), "cua", "libs", "python")
-if cua_path not in sys.path:
-    sys.path.insert(0, cua_path)
-
-# Also add individual package paths (needed for inter-package imports)
-agent_path = os.path.join(cua_path, "agent")
-computer_path = os.path.join(cua_path, "computer")
-core_path = os.path.join(cua_path, "core")
-
-for path in [agent_path, computer_path, core_path]:
-    if path not in sys.path:
-        sys.path.insert(0, path)
+# Add local CUA packages to Python path (for development)
+from _background_load import discard_load, load_in_background
+from _cua_paths import add_cua_paths
+add_cua_paths()
 
 # Import CUA components
 from computer import Computer, VMProviderType
-from agent.adapters.models.ui_venus_ground import UIVenusGroundModel
+from agent.loops.ui_venus_ground import UIVenusGroundModel
+from aioconsole import ainput
+
+# Worker threads for the model load and predictions, shared by the whole session
+GROUNDING_POOL_SIZE = min(8, os.cpu_count() or 4)
+
+
+async def run_in_pool(pool, fn, *args, **kwargs):
+    """Run a blocking call on the session's thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(pool, functools.partial(fn, *args, **kwargs))
+
+
+class ScreenshotDoubleBuffer:
+    """Captures screenshots in the background into two alternating buffers.
+
+    One buffer is being filled over the Docker socket while the other holds the latest
+    complete frame, so commands read a ready screenshot instead of waiting for a capture.
+    """
+
+    def __init__(self, computer_instance, interval=0.5):
+        self.computer_instance = computer_instance
+        self.interval = interval
+        self._buffers = [None, None]
+        self._active = 0
+        self._captured = 0
+        self._fresh = asyncio.Event()
+        self._last_error = None
+        self._task = None
+
+    async def start(self):
+        self._buffers[0] = await self.computer_instance.interface.screenshot()
+        self._task = asyncio.create_task(self._produce())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+
+    @property
+    def latest(self):
+        """Most recent complete frame."""
+        return self._buffers[self._active]
+
+    async def next_frame(self, timeout=10.0):
+        """Wait for a frame whose capture started after this call (e.g. after a click).
+
+        Raises TimeoutError, chained to the last capture error if there was one, when no
+        such frame arrives within ``timeout`` seconds.
+        """
+        # The capture in flight may predate the call, so wait for the one after it
+        target = self._captured + 2
+        self._last_error = None
+
+        async def wait_for_target():
+            while self._captured < target:
+                self._fresh.clear()
+                await self._fresh.wait()
+
+        try:
+            await asyncio.wait_for(wait_for_target(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"No new screenshot within {timeout}s") from self._last_error
+        return self.latest
+
+    async def _produce(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                inactive = 1 - self._active
+                self._buffers[inactive] = await self.computer_instance.interface.screenshot()
+                self._active = inactive
+                self._captured += 1
+                self._fresh.set()
+            except Exception as e:
+                self._last_error = e
+                print(f"⚠️  Background screenshot failed: {e}")
 
 async def main():
     """Main function to run the interactive grounding model tester."""
@@ -40,9 +105,21 @@ async def main():
         return
 
     computer_instance = None
-    grounding_model = None
+    screenshots = None
+    model_task = None
+    pool = ThreadPoolExecutor(max_workers=GROUNDING_POOL_SIZE, thread_name_prefix="grounding")
     
     try:
+        # Start loading the model right away on a daemon thread so the multi-GB
+        # checkpoint load overlaps with the Docker startup below
+        print("🤖 Loading UI-Venus grounding model in the background...")
+        model_task = load_in_background(
+            UIVenusGroundModel,
+            model_name="inclusionAI/UI-Venus-Ground-7B",
+            # INT8 weights roughly halve VRAM for the 7B; use "bnb4" (NF4) for 32B/72B
+            quantization_scheme="bnb8",
+        )
+
         print("📦 Setting up Docker computer...")
         computer_instance = Computer(
             os_type="linux",
@@ -52,31 +129,28 @@ async def main():
         )
         await computer_instance.run()
         
-        print("🤖 Loading UI-Venus grounding model...")
-        grounding_model = UIVenusGroundModel(
-            model_name="inclusionAI/UI-Venus-Ground-7B",
-            # quantization_bits=8
-        )
-        
+        # The model keeps loading while the user types the first description
         print("✅ Setup complete! Starting interactive mode...")
         print("\nCommands:")
         print("  - Type any element description to get coordinates")
-        print("  - Type 'screenshot' to take a new screenshot")
+        print("  - Separate several descriptions with ';' to ground them in one batch")
+        print("  - Type 'screenshot' to use the latest background screenshot")
         print("  - Type 'quit' or 'exit' to stop")
         print("  - Type 'help' for more commands")
         print("-" * 50)
         
         # Take initial screenshot
         print("📸 Taking initial screenshot...")
-        screenshot_bytes = await computer_instance.interface.screenshot()
-        screenshot_b64 = base64.b64encode(screenshot_bytes).decode('utf-8')
-        print(f"✅ Screenshot taken (size: {len(screenshot_b64)} chars)")
+        # The model runs in-process, so raw PNG bytes are passed without base64 encoding
+        screenshots = ScreenshotDoubleBuffer(computer_instance)
+        await screenshots.start()
+        print(f"✅ Screenshot taken (size: {len(screenshots.latest)} bytes)")
         
         # Interactive loop
         while True:
             try:
-                # Get user input
-                user_input = input("\n🎯 Enter element description (or command): ").strip()
+                # Get user input without blocking the background tasks
+                user_input = (await ainput("\n🎯 Enter element description (or command): ")).strip()
                 
                 if not user_input:
                     continue
@@ -87,25 +161,47 @@ async def main():
                     break
                 elif user_input.lower() == 'help':
                     print("\n📖 Available commands:")
-                    print("  screenshot - Take a new screenshot")
+                    print("  screenshot - Use the latest background screenshot")
                     print("  quit/exit/q - Exit the program")
                     print("  help - Show this help message")
+                    print("  a; b; c - Predict coordinates for several elements in one batch")
                     print("  Any other text - Predict coordinates for that element")
                     continue
                 elif user_input.lower() == 'screenshot':
-                    print("📸 Taking new screenshot...")
-                    screenshot_bytes = await computer_instance.interface.screenshot()
-                    screenshot_b64 = base64.b64encode(screenshot_bytes).decode('utf-8')
-                    print(f"✅ New screenshot taken (size: {len(screenshot_b64)} chars)")
+                    # Already captured in the background; no round trip to wait for
+                    print(f"✅ Using latest screenshot (size: {len(screenshots.latest)} bytes)")
                     continue
+
+                if not model_task.done():
+                    print("⏳ Waiting for the grounding model to finish loading...")
+                grounding_model = await model_task
+                screenshot_bytes = screenshots.latest
                 
+                # Several descriptions share one screenshot: decode it once and
+                # ground them together in a single forward pass
+                instructions = [part.strip() for part in user_input.split(';') if part.strip()]
+                if len(instructions) > 1:
+                    print(f"🔍 Predicting coordinates for {len(instructions)} elements...")
+                    print("⏳ Processing...")
+                    batch_coords = await run_in_pool(
+                        pool, grounding_model.predict_click_batched, screenshot_bytes, instructions
+                    )
+                    for instruction, coords in zip(instructions, batch_coords):
+                        if coords:
+                            print(f"✅ '{instruction}': ({coords[0]}, {coords[1]})")
+                        else:
+                            print(f"❌ '{instruction}': failed to predict coordinates")
+                    continue
+
                 # Predict coordinates
                 print(f"🔍 Predicting coordinates for: '{user_input}'")
                 print("⏳ Processing...")
                 
-                coords = grounding_model.predict_click(
-                    image_b64=screenshot_b64,
-                    instruction=user_input
+                coords = await run_in_pool(
+                    pool,
+                    grounding_model.predict_click_bytes,
+                    screenshot_bytes,
+                    user_input
                 )
                 
                 if coords:
@@ -113,7 +209,7 @@ async def main():
                     print(f"✅ Predicted coordinates: ({x}, {y})")
                     
                     # Ask if user wants to click
-                    click_choice = input("🖱️  Do you want to click at these coordinates? (y/n): ").strip().lower()
+                    click_choice = (await ainput("🖱️  Do you want to click at these coordinates? (y/n): ")).strip().lower()
                     if click_choice in ['y', 'yes']:
                         print(f"🖱️  Clicking at ({x}, {y})...")
                         await computer_instance.interface.left_click(x, y)
@@ -121,8 +217,7 @@ async def main():
                         
                         # Take new screenshot after click
                         print("📸 Taking screenshot after click...")
-                        screenshot_bytes = await computer_instance.interface.screenshot()
-                        screenshot_b64 = base64.b64encode(screenshot_bytes).decode('utf-8')
+                        await screenshots.next_frame()
                         print("✅ New screenshot taken")
                 else:
                     print("❌ Failed to predict coordinates")
@@ -138,9 +233,19 @@ async def main():
         print(f"❌ Error during setup: {e}")
         raise
     finally:
+        if screenshots:
+            screenshots.stop()
+        if model_task is not None:
+            discard_load(model_task)
+        pool.shutdown(wait=False, cancel_futures=True)
         if computer_instance:
             # await computer_instance.stop()
             print("\n🧹 Computer connection closed")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -3,24 +3,46 @@
 Test script to verify that local CUA imports are working correctly.
 """
 
+import importlib
 import os
 import sys
 
-# Add local CUA directory to Python path
-cua_path = os.path.join(os.path.dirname(__file__), "cua", "libs", "python")
-if cua_path not in sys.path:
-    sys.path.insert(0, cua_path)
+from _cua_paths import CUA_PATH, add_cua_paths
 
-# Also add individual package paths (needed for inter-package imports)
-agent_path = os.path.join(cua_path, "agent")
-computer_path = os.path.join(cua_path, "computer")
-core_path = os.path.join(cua_path, "core")
+# Add local CUA packages to Python path
+add_cua_paths()
+cua_path = CUA_PATH
 
-for path in [agent_path, computer_path, core_path]:
-    if path not in sys.path:
-        sys.path.insert(0, path)
+# (path, mtime) -> loaded module or the import error, so each file is executed once per run
+_module_cache = {}
 
-print(f"Added to sys.path: {cua_path}")
+
+def load_module(name, path):
+    """Import a local module once and reuse the result until its file changes.
+
+    The module is imported under its package name, so it lands in sys.modules and the
+    later agent package imports reuse it instead of executing the file again. A failed
+    import is cached as well and re-raised, not retried.
+    """
+    key = (path, os.stat(path).st_mtime_ns)
+    if key not in _module_cache:
+        try:
+            module = importlib.import_module(name)
+            if not os.path.samefile(module.__file__, path):
+                raise ImportError(f"{name} resolved to {module.__file__}, expected {path}")
+            _module_cache[key] = module
+        except Exception as e:
+            _module_cache[key] = e
+    result = _module_cache[key]
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+# UIVenusGroundConfig and UIVenusGroundModel both live in the UI-Venus loop module
+ui_venus_path = os.path.join(cua_path, "agent", "agent", "loops", "ui_venus_ground.py")
+
+print(f"Local CUA packages: {cua_path}")
 print(f"Current sys.path includes: {[p for p in sys.path if 'cua' in p.lower()]}")
 
 try:
@@ -32,66 +54,33 @@ try:
 
     # Test UI-Venus loop directly
     try:
-        import importlib.util
-        spec = importlib.util.spec_from_file_location(
-            "ui_venus_ground_loop",
-            os.path.join(cua_path, "agent", "agent", "loops", "ui_venus_ground_loop.py")
-        )
-        if spec and spec.loader:
-            ui_venus_loop = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(ui_venus_loop)
-            print("✅ UIVenusGroundConfig module loaded successfully")
-        else:
-            print("⚠️  Could not load UIVenusGroundConfig module")
+        load_module("agent.loops.ui_venus_ground", ui_venus_path)
+        print("✅ UIVenusGroundConfig module loaded successfully")
     except Exception as e:
         print(f"⚠️  UIVenusGroundConfig direct load failed: {e}")
 
-    # Test UI-Venus model directly
-    try:
-        spec = importlib.util.spec_from_file_location(
-            "ui_venus_ground",
-            os.path.join(cua_path, "agent", "agent", "adapters", "models", "ui_venus_ground.py")
-        )
-        if spec and spec.loader:
-            ui_venus_model = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(ui_venus_model)
-            print("✅ UIVenusGroundModel module loaded successfully")
-        else:
-            print("⚠️  Could not load UIVenusGroundModel module")
-    except Exception as e:
-        print(f"⚠️  UIVenusGroundModel direct load failed: {e}")
-
     # Test that we can run the example script (this is the main goal)
     print("\nTesting example script compatibility...")
     try:
         # This simulates what the example script does
-        import sys
         example_script_path = os.path.join(os.path.dirname(__file__), "example_ui_venus_gemini.py")
 
         # Check if the script exists and has the right imports
         with open(example_script_path, 'r') as f:
             content = f.read()
 
-        if 'sys.path.insert' in content and 'cua_path' in content:
+        if 'add_cua_paths()' in content:
             print("✅ Example script has proper local path setup")
         else:
             print("⚠️  Example script may not have local path setup")
 
         # Test that we can import our UI-Venus model from the local path
-        import importlib.util
-        ui_venus_spec = importlib.util.spec_from_file_location(
-            "ui_venus_ground",
-            os.path.join(cua_path, "agent", "agent", "adapters", "models", "ui_venus_ground.py")
-        )
-        if ui_venus_spec and ui_venus_spec.loader:
-            ui_venus_module = importlib.util.module_from_spec(ui_venus_spec)
-            ui_venus_spec.loader.exec_module(ui_venus_module)
-            if hasattr(ui_venus_module, 'UIVenusGroundModel'):
-                print("✅ UI-Venus model is ready for use")
-            else:
-                print("⚠️  UI-Venus model class not found")
+        # (same module as above, served from the cache)
+        ui_venus_module = load_module("agent.loops.ui_venus_ground", ui_venus_path)
+        if hasattr(ui_venus_module, 'UIVenusGroundModel'):
+            print("✅ UI-Venus model is ready for use")
         else:
-            print("⚠️  Could not load UI-Venus model")
+            print("⚠️  UI-Venus model class not found")
 
         # Test that agent configs are registered
         try:
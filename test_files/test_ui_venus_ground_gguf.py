@@ -15,26 +15,20 @@ Usage examples:
     --gguf /abs/path/UI-Venus-Ground-7B.Q8_0.gguf \
     --instruction "Firefox Web Browser" \
     --instruction "search bar"
+
+Repeated instructions on one screenshot share the image prompt prefix, which the server's
+prompt cache reuses. Quantizing that KV cache to Q8_0 halves its memory, e.g. for llama.cpp:
+  llama-server -m UI-Venus-Ground-7B.Q8_0.gguf --mmproj mmproj.gguf \
+    --flash-attn --cache-type-k q8_0 --cache-type-v q8_0
+(LM Studio exposes the same K/V cache quantization in the model load settings.)
 """
 
 import os
-import sys
 import base64
 import asyncio
 import argparse
 
-
-def add_cua_paths() -> None:
-    base_dir = os.path.dirname(__file__)
-    cua_path = os.path.join(base_dir, "cua", "libs", "python")
-    # Add common subpackages for robustness (matches example script)
-    agent_path = os.path.join(cua_path, "agent")
-    computer_path = os.path.join(cua_path, "computer")
-    core_path = os.path.join(cua_path, "core")
-    # Ensure 'agent' resolves to the subpackage (agent/agent) by prioritizing agent_path
-    for path in [agent_path, cua_path, computer_path, core_path]:
-        if path not in sys.path:
-            sys.path.insert(0, path)
+from _cua_paths import add_cua_paths
 
 
 async def main() -> int:
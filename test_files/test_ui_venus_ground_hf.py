@@ -17,30 +17,18 @@ Usage examples:
     --instruction "search bar"
 """
 
-import os
-import sys
-import base64
 import asyncio
 import argparse
 
-
-def add_cua_paths() -> None:
-    base_dir = os.path.dirname(__file__)
-    cua_path = os.path.join(base_dir, "cua", "libs", "python")
-    agent_path = os.path.join(cua_path, "agent")
-    computer_path = os.path.join(cua_path, "computer")
-    core_path = os.path.join(cua_path, "core")
-    for path in [agent_path, cua_path, computer_path, core_path]:
-        if path not in sys.path:
-            sys.path.insert(0, path)
+from _background_load import discard_load, load_in_background
+from _cua_paths import add_cua_paths
 
 
 async def main() -> int:
     add_cua_paths()
 
     # Lazy import after sys.path setup
-    from agent.adapters.models.ui_venus_ground import UIVenusGroundModel  # type: ignore
-    from agent.computers.cua import cuaComputerHandler  # type: ignore
+    from agent.loops.ui_venus_ground import UIVenusGroundModel  # type: ignore
     from computer import Computer, VMProviderType  # type: ignore
 
     # Direct configuration variables (no CLI args)
@@ -62,35 +50,42 @@ async def main() -> int:
         image="trycua/cua-ubuntu:latest",
     )
 
+    # Multi-GB checkpoint load on a daemon thread, overlapped with the container boot below
+    print("🤖 Loading UI-Venus model (HF) in the background...")
+    model_task = load_in_background(UIVenusGroundModel, model_name=HF_MODEL, quantization_bits=8)
+
     try:
         print("📦 Starting CUA computer (Docker)...")
         await computer.run()
         print("📸 Taking screenshot via CUA...")
-        handler = cuaComputerHandler(computer)
-        await handler._initialize()
-        image_b64 = await handler.screenshot()
-        if not image_b64:
+        # Raw PNG bytes go straight to the model, no base64 round trip
+        screenshot_bytes = await computer.interface.screenshot()
+        if not screenshot_bytes:
             print("❌ Failed to capture screenshot from CUA")
             return 1
 
-        # Prepare HF model
+        # Wait for the HF model
         try:
-            model = UIVenusGroundModel(model_name=HF_MODEL, quantization_bits=8)
+            model = await model_task
         except Exception as e:
             print("❌ Failed to initialize UIVenusGroundModel (HF):", e)
             print("   Ensure you have: pip install transformers torch qwen-vl-utils Pillow")
             return 1
 
-        # Run tests
-        for desc in instructions:
+        # Run tests: every instruction targets the same screenshot, so ground them together
+        # in batched forward passes (capped at BATCH_MAX_SIZE to bound GPU memory)
+        all_coords = await asyncio.to_thread(model.predict_click_batched, screenshot_bytes, instructions)
+
+        for desc, coords in zip(instructions, all_coords):
             print(f"\n🎯 Instruction: '{desc}'")
-            coords = model.predict_click(image_b64=image_b64, instruction=desc)
             if coords:
                 print(f"✅ Predicted center coordinates: {coords}")
             else:
                 print("❌ No coordinates predicted")
 
     finally:
+        # Early returns and Docker failures leave the load unawaited
+        discard_load(model_task)
         try:
             await computer.close()
             print("🧹 Computer connection closed")